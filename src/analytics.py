@@ -1,19 +1,29 @@
 # src/analytics.py - Fixed and enhanced version
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
 from collections import defaultdict
+import heapq
 import pytz
 from src.sheets import SheetsClient
 
 
 class AnalyticsEngine:
-    def __init__(self, sheets_client: SheetsClient):
+    def __init__(
+        self,
+        sheets_client: SheetsClient,
+        apps_fetcher: Optional[Callable[[str], List[Dict[str, Any]]]] = None
+    ):
         self.sheets = sheets_client
+        # Every method starts from the per-language application rows, so
+        # callers that already cache them (the web layer's TTL apps cache)
+        # inject their fetcher here instead of paying a sheet read per
+        # method call. Default is a direct read.
+        self._fetch_apps = apps_fetcher or sheets_client.get_applications_for_followup
 
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """Get comprehensive dashboard statistics."""
-        apps_en = self.sheets.get_applications_for_followup('en')
-        apps_fr = self.sheets.get_applications_for_followup('fr')
+        apps_en = self._fetch_apps('en')
+        apps_fr = self._fetch_apps('fr')
         all_apps = apps_en + apps_fr
 
         if not all_apps:
@@ -97,8 +107,8 @@ class AnalyticsEngine:
 
     def get_timeline_data(self, days: int = 30) -> Dict[str, List]:
         """Get application timeline for the last N days."""
-        apps_en = self.sheets.get_applications_for_followup('en')
-        apps_fr = self.sheets.get_applications_for_followup('fr')
+        apps_en = self._fetch_apps('en')
+        apps_fr = self._fetch_apps('fr')
         all_apps = apps_en + apps_fr
 
         # Group by date
@@ -137,8 +147,8 @@ class AnalyticsEngine:
 
     def get_company_heatmap(self, limit: int = 10) -> List[Dict]:
         """Get top companies by application count."""
-        apps_en = self.sheets.get_applications_for_followup('en')
-        apps_fr = self.sheets.get_applications_for_followup('fr')
+        apps_en = self._fetch_apps('en')
+        apps_fr = self._fetch_apps('fr')
         all_apps = apps_en + apps_fr
 
         company_counts = defaultdict(int)
@@ -149,22 +159,22 @@ class AnalyticsEngine:
             if company and company.lower() not in ['unknown company', 'entreprise inconnue', '']:
                 company_counts[company] += 1
 
-        # Sort and limit
-        sorted_companies = sorted(
+        # Top-N without sorting every company
+        top_companies = heapq.nlargest(
+            limit,
             company_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
+            key=lambda x: x[1]
+        )
 
         return [
             {'company': company, 'count': count}
-            for company, count in sorted_companies
+            for company, count in top_companies
         ]
 
     def get_status_distribution(self) -> Dict[str, int]:
         """Get distribution of application statuses."""
-        apps_en = self.sheets.get_applications_for_followup('en')
-        apps_fr = self.sheets.get_applications_for_followup('fr')
+        apps_en = self._fetch_apps('en')
+        apps_fr = self._fetch_apps('fr')
         all_apps = apps_en + apps_fr
 
         status_counts = defaultdict(int)
@@ -177,8 +187,8 @@ class AnalyticsEngine:
 
     def get_followup_effectiveness(self) -> Dict[str, Any]:
         """Analyze follow-up effectiveness."""
-        apps_en = self.sheets.get_applications_for_followup('en')
-        apps_fr = self.sheets.get_applications_for_followup('fr')
+        apps_en = self._fetch_apps('en')
+        apps_fr = self._fetch_apps('fr')
         all_apps = apps_en + apps_fr
 
         followup_distribution = defaultdict(int)
@@ -214,8 +224,8 @@ class AnalyticsEngine:
 
     def get_response_breakdown(self) -> Dict[str, Any]:
         """Get detailed breakdown of responses."""
-        apps_en = self.sheets.get_applications_for_followup('en')
-        apps_fr = self.sheets.get_applications_for_followup('fr')
+        apps_en = self._fetch_apps('en')
+        apps_fr = self._fetch_apps('fr')
         all_apps = apps_en + apps_fr
 
         breakdown = {
@@ -265,8 +275,8 @@ class AnalyticsEngine:
 
     def get_weekly_stats(self) -> Dict[str, Any]:
         """Get statistics for the current week."""
-        apps_en = self.sheets.get_applications_for_followup('en')
-        apps_fr = self.sheets.get_applications_for_followup('fr')
+        apps_en = self._fetch_apps('en')
+        apps_fr = self._fetch_apps('fr')
         all_apps = apps_en + apps_fr
 
         tz = pytz.UTC
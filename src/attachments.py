@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from rich.console import Console
 from rich.table import Table
@@ -39,6 +39,14 @@ class AttachmentSelector:
 
         return sorted(files, key=lambda p: p.name.lower())
 
+    def preload(self, language: str) -> Dict[str, Path]:
+        """Map filename -> Path for every attachment in one folder scan.
+
+        Callers resolving many filenames (the follow-up engine) build
+        this once and look up in O(1) instead of stat'ing per row.
+        """
+        return {p.name: p for p in self.get_attachments(language)}
+
     # ---------------------------------------------------------
     # ATTACHMENT SELECTION
     # ---------------------------------------------------------
@@ -124,7 +124,8 @@ class GoogleAuthenticator:
                 "Service Accounts cannot send Gmail emails. Use OAuth2 mode."
             )
 
-        return build("gmail", "v1", credentials=self.creds)
+        # static_discovery avoids an HTTP fetch of the discovery document
+        return build("gmail", "v1", credentials=self.creds, static_discovery=True)
 
     # ---------------------------
     # Sheets API
@@ -133,7 +134,7 @@ class GoogleAuthenticator:
         if not self.creds:
             self.authenticate()
 
-        return build("sheets", "v4", credentials=self.creds)
+        return build("sheets", "v4", credentials=self.creds, static_discovery=True)
 
     # ---------------------------
     # Static helper for both services
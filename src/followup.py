@@ -5,7 +5,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from src.sheets import SheetsClient
 from src.mailer import GmailMailer
 from src.attachments import AttachmentSelector
-from src.utils import is_followup_due, validate_email
+from src.utils import filter_due, validate_email
 
 
 console = Console()
@@ -50,13 +50,16 @@ class FollowupEngine:
             "errors": []
         }
 
+        # One batchGet covers every language instead of a values.get each
+        apps_by_lang = self.sheets.get_applications_for_followup_multi(languages)
+
         for lang in languages:
             console.print(f"\n[bold]Processing {lang.upper()} follow-ups...[/bold]")
 
-            applications = self.sheets.get_applications_for_followup(lang)
+            applications = apps_by_lang.get(lang, [])
 
             # Filter due
-            due_apps = [app for app in applications if is_followup_due(app["next_followup_date"])]
+            due_apps = filter_due(applications)
 
             if not due_apps:
                 console.print(f"[green]No follow-ups due for {lang.upper()}[/green]")
@@ -64,6 +67,9 @@ class FollowupEngine:
 
             console.print(f"[cyan]Found {len(due_apps)} applications needing follow-up[/cyan]")
 
+            # One folder scan resolves every CV instead of a stat per app
+            attachment_map = self.attachments.preload(lang)
+
             # Process pipeline
             with Progress(
                 SpinnerColumn(),
@@ -76,7 +82,7 @@ class FollowupEngine:
                 for app in due_apps:
                     progress.update(task, description=f"{app['email']}")
 
-                    result = self._process_single_followup(app, lang, dry_run)
+                    result = self._process_single_followup(app, lang, dry_run, attachment_map)
 
                     if result["status"] == "sent":
                         stats["sent"] += 1
@@ -91,6 +97,15 @@ class FollowupEngine:
 
                     progress.advance(task)
 
+        # Ship the buffered follow-up updates in one batchUpdate. The
+        # emails are already out, so a transient flush failure must not
+        # abort the run — flush() re-queues the batch and a later flush
+        # retries it.
+        try:
+            self.sheets.flush()
+        except Exception as e:
+            console.print(f"[red]Failed to flush follow-up updates (kept queued for retry): {e}[/red]")
+
         # Summary
         console.print("\n[bold]Follow-up Summary:[/bold]")
         console.print(f"  ✓ Sent: {stats['sent']}")
@@ -104,6 +119,11 @@ class FollowupEngine:
 
         return stats
 
+    def _log_skip(self, app_id: str, email: str, details: str, dry_run: bool):
+        """Record a skipped follow-up; dry runs preview and write nothing."""
+        if not dry_run:
+            self.sheets.log_activity(app_id, email, "followup_skipped", "failed", details)
+
     # ---------------------------------------------------------
     # SINGLE FOLLOW-UP HANDLER
     # ---------------------------------------------------------
@@ -111,7 +131,8 @@ class FollowupEngine:
         self,
         app: Dict[str, Any],
         language: str,
-        dry_run: bool
+        dry_run: bool,
+        attachment_map: Dict[str, Any]
     ) -> Dict[str, str]:
         """Process follow-up for a single application."""
 
@@ -120,28 +141,25 @@ class FollowupEngine:
 
         # ------ VALIDATIONS ------
         if not email or not validate_email(email):
-            self.sheets.log_activity(app_id, email, "followup_skipped", "failed", "Invalid email address")
+            self._log_skip(app_id, email, "Invalid email address", dry_run)
             return {"status": "skipped", "error": "Invalid email"}
 
         if not app.get("body"):
-            self.sheets.log_activity(app_id, email, "followup_skipped", "failed", "Missing email body")
+            self._log_skip(app_id, email, "Missing email body", dry_run)
             return {"status": "skipped", "error": "Missing body"}
 
         if not app.get("cv"):
-            self.sheets.log_activity(app_id, email, "followup_skipped", "failed", "Missing CV filename")
+            self._log_skip(app_id, email, "Missing CV filename", dry_run)
             return {"status": "skipped", "error": "Missing CV"}
 
         subject = app.get("position", "").strip()
         if not subject:
             subject = "Follow-up"
 
-        # Check attachment
-        attachment_path = self.attachments.get_attachment_path(language, app["cv"])
+        # Check attachment against the per-run preloaded map
+        attachment_path = attachment_map.get(app["cv"])
         if not attachment_path:
-            self.sheets.log_activity(
-                app_id, email, "followup_skipped", "failed",
-                f"Attachment not found: {app['cv']}"
-            )
+            self._log_skip(app_id, email, f"Attachment not found: {app['cv']}", dry_run)
             return {"status": "skipped", "error": f"Attachment not found: {app['cv']}"}
 
         # ------ DRY RUN ------
@@ -158,8 +176,14 @@ class FollowupEngine:
                 attachment_path=attachment_path
             )
 
+            # Buffered: the bookkeeping for every sent follow-up lands in
+            # one batchUpdate when process_followups flushes, instead of
+            # a write-quota unit per application.
             new_followup_count = app["followups"] + 1
-            self.sheets.update_application_followup(app_id, language, new_followup_count)
+            self.sheets.queue_update_application_followup(
+                app_id, language, new_followup_count,
+                app.get("next_followup_date")
+            )
 
             self.sheets.log_activity(
                 app_id, email, "followup_sent", "success",
@@ -11,6 +11,7 @@ from typing import Optional
 import time
 import random
 import socket
+import threading
 
 import backoff
 from googleapiclient.discovery import Resource
@@ -30,6 +31,12 @@ class GmailMailer:
         # Extract display name from environment or use default
         self.display_name = "Aimen Berkane"  # ✅ Professional sender name
         self.hostname = socket.getfqdn()  # Get machine hostname for Message-ID
+        # The discovery Resource shares one httplib2.Http connection, which
+        # is not thread-safe; concurrent senders (CLI worker pool, web
+        # executor) must take turns on the wire. Message building and the
+        # send_with_delay jitter stay outside the lock, so only the actual
+        # HTTPS exchange is serialized.
+        self._api_lock = threading.Lock()
 
     # ---------------------------------------------------------
     # EMAIL SENDING (WITH AUTHENTICATION HEADERS)
@@ -135,10 +142,11 @@ class GmailMailer:
 
         # ----------- SEND REQUEST -----------
         try:
-            result = self.service.users().messages().send(
-                userId="me",
-                body={"raw": raw_message}
-            ).execute()
+            with self._api_lock:
+                result = self.service.users().messages().send(
+                    userId="me",
+                    body={"raw": raw_message}
+                ).execute()
 
             # Calculate duration
             duration_ms = (time_module.time() - start_time) * 1000
@@ -215,11 +223,12 @@ class GmailMailer:
         """
 
         try:
-            message = self.service.users().messages().get(
-                userId="me",
-                id=message_id,
-                format="full"
-            ).execute()
+            with self._api_lock:
+                message = self.service.users().messages().get(
+                    userId="me",
+                    id=message_id,
+                    format="full"
+                ).execute()
 
             headers = message.get("payload", {}).get("headers", [])
 
@@ -1,7 +1,12 @@
-from typing import List, Dict, Optional, Any
+import atexit
+import json
+import queue
+import re
+import threading
+from typing import List, Dict, Optional, Any, Tuple
 from googleapiclient.discovery import Resource
 
-from src.config import SPREADSHEET_ID, SHEET_EN, SHEET_FR, SHEET_ACTIVITY, SHEET_COMPANIES
+from src.config import PROJECT_ROOT, SPREADSHEET_ID, SHEET_EN, SHEET_FR, SHEET_ACTIVITY, SHEET_COMPANIES
 from src.utils import (
     generate_id, get_current_timestamp, calculate_next_followup,
     get_default_company, get_default_position
@@ -28,6 +33,10 @@ ACTIVITY_LOG_COLUMNS = [
     'Timestamp', 'ID', 'Email', 'Action', 'Result', 'Details'
 ]
 
+# Local append-only mirror of the activity log; the Sheets push happens in
+# the background so a slow or failing API call never blocks the caller.
+ACTIVITY_LOG_FILE = PROJECT_ROOT / "logs" / "activity.jsonl"
+
 
 class SheetsClient:
     """Client for interacting with Google Sheets API."""
@@ -35,6 +44,33 @@ class SheetsClient:
     def __init__(self, service: Resource):
         self.service = service
         self.spreadsheet_id = SPREADSHEET_ID
+        # Row indices learned from append responses and column scans,
+        # keyed by (sheet_name, row_id). Avoids re-scanning column A on updates.
+        self._id_row_cache: Dict[Tuple[str, str], int] = {}
+        # lowercased company name -> (row_index, company_dict), built as a side
+        # effect of get_all_companies. None means "needs a fresh fetch".
+        self._companies_by_name_lower: Optional[Dict[str, Tuple[int, Dict[str, Any]]]] = None
+        # Buffered writes collected by the queue_* methods and shipped in
+        # bulk by flush() — one batchUpdate plus one append instead of a
+        # round-trip per mutation.
+        self._pending_value_updates: List[Dict[str, Any]] = []
+        self._pending_activity_rows: List[List[Any]] = []
+        # Activity rows waiting for the background Sheets push
+        self._activity_queue: "queue.Queue[List[Any]]" = queue.Queue()
+        self._activity_worker: Optional[threading.Thread] = None
+        # Sheet title -> numeric sheetId; ids never change, so one
+        # spreadsheets.get fills this for the life of the client.
+        self._sheet_id_cache: Dict[str, int] = {}
+        # One client is shared by the web executor, the CLI send pool and
+        # the activity drain thread, but the underlying httplib2.Http is
+        # not thread-safe — every API call takes this lock so only one
+        # request is on the wire at a time.
+        self._api_lock = threading.Lock()
+        # The activity drain thread is a daemon, so without this hook a
+        # short-lived CLI process (e.g. `add`) could exit with rows still
+        # queued for Sheets; flush() waits the queue out and also ships
+        # anything left in the write buffers.
+        atexit.register(self.flush)
 
     # Add these wrapper methods to track API calls:
     def _execute_sheets_api(self, operation_name: str, api_call):
@@ -42,7 +78,8 @@ class SheetsClient:
         start_time = time_module.time()
 
         try:
-            result = api_call()
+            with self._api_lock:
+                result = api_call()
             duration_ms = (time_module.time() - start_time) * 1000
 
             # Log successful API call
@@ -73,6 +110,21 @@ class SheetsClient:
         """Return sheet name for given language."""
         return SHEET_EN if language == 'en' else SHEET_FR
 
+    def _get_sheet_id(self, sheet_name: str) -> Optional[int]:
+        """Resolve a sheet title to its numeric sheetId, memoized."""
+        if sheet_name not in self._sheet_id_cache:
+            spreadsheet = self._execute_sheets_api(
+                'get_spreadsheet',
+                lambda: self.service.spreadsheets().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    fields="sheets(properties(sheetId,title))"
+                ).execute()
+            )
+            for sheet in spreadsheet.get("sheets", []):
+                props = sheet["properties"]
+                self._sheet_id_cache[props["title"]] = props["sheetId"]
+        return self._sheet_id_cache.get(sheet_name)
+
     def initialize_sheets(self):
         """Initialize sheet headers if they don't exist."""
         self._ensure_headers(SHEET_EN, APPLICATION_COLUMNS)
@@ -140,10 +192,62 @@ class SheetsClient:
         sheet_name = self._get_sheet_name(language)
         app_id = generate_id()
 
+        row = self._build_application_row(
+            app_id, email, language,
+            company=company, position=position, body=body,
+            cv_filename=cv_filename, phone=phone, website=website,
+            notes=notes, status=status, company_type=company_type,
+            salary=salary, place=place, reference=reference
+        )
+
+        # Use monitored API call
+        resp = self._execute_sheets_api(
+            'append_row',
+            lambda: self.service.spreadsheets().values().append(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{sheet_name}!A:Q",  # Updated range to include new columns
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": [row]}
+            ).execute()
+        )
+
+        # The append response tells us where the row landed (e.g. "Sheet1!A42:Q42"),
+        # so a follow-up update doesn't need a full-column scan to find it.
+        self._cache_row_from_append(sheet_name, app_id, resp)
+
+        system_monitor.log_event(
+            'application_added',
+            'info',
+            f'Application added successfully',
+            {'app_id': app_id, 'email': email, 'language': language}
+        )
+
+        return app_id
+
+    def _build_application_row(
+        self,
+        app_id: str,
+        email: str,
+        language: str,
+        company: Optional[str] = None,
+        position: Optional[str] = None,
+        body: Optional[str] = None,
+        cv_filename: Optional[str] = None,
+        phone: Optional[str] = None,
+        website: Optional[str] = None,
+        notes: Optional[str] = None,
+        status: str = 'Pending',
+        company_type: Optional[str] = None,
+        salary: Optional[str] = None,
+        place: Optional[str] = None,
+        reference: Optional[str] = None
+    ) -> List[Any]:
+        """Assemble one sheet row in column order (A through Q)."""
         company = company.strip() if company else get_default_company(language)
         position = position.strip() if position else get_default_position(language)
 
-        row = [
+        return [
             app_id,
             company,
             email,
@@ -157,48 +261,67 @@ class SheetsClient:
             body or "",
             cv_filename or "",
             notes or "",
-            company_type or "",  # NEW
-            salary or "",  # NEW
-            place or "",  # NEW
-            reference or ""  # NEW
+            company_type or "",
+            salary or "",
+            place or "",
+            reference or ""
         ]
 
-        # Use monitored API call
-        self._execute_sheets_api(
-            'append_row',
+    def add_applications_bulk(self, applications: List[Dict[str, Any]], language: str) -> List[str]:
+        """Insert several application rows with one append call.
+
+        Each dict takes the same keys as add_application's keyword
+        arguments (email is required). Returns the generated ids in
+        input order; N inserts cost one values.append instead of N.
+        """
+        if not applications:
+            return []
+
+        sheet_name = self._get_sheet_name(language)
+
+        app_ids = []
+        rows = []
+        for fields in applications:
+            app_id = generate_id()
+            app_ids.append(app_id)
+            # Callers often pass dicts built from parsed rows; drop the
+            # keys this method supplies itself so they can't collide with
+            # the generated id or the language argument.
+            fields = {k: v for k, v in fields.items() if k not in ("app_id", "language")}
+            rows.append(self._build_application_row(app_id, language=language, **fields))
+
+        resp = self._execute_sheets_api(
+            'append_rows',
             lambda: self.service.spreadsheets().values().append(
                 spreadsheetId=self.spreadsheet_id,
-                range=f"{sheet_name}!A:Q",  # Updated range to include new columns
+                range=f"{sheet_name}!A:Q",
                 valueInputOption="RAW",
                 insertDataOption="INSERT_ROWS",
-                body={"values": [row]}
+                body={"values": rows}
             ).execute()
         )
 
-        system_monitor.log_event(
-            'application_added',
-            'info',
-            f'Application added successfully',
-            {'app_id': app_id, 'email': email, 'language': language}
-        )
+        # updatedRange covers the whole inserted block (e.g.
+        # "Sheet1!A42:Q44"); seed the row cache for every id from its
+        # offset within it.
+        updated_range = (resp or {}).get("updates", {}).get("updatedRange", "")
+        match = re.search(r"!A(\d+)", updated_range)
+        if match:
+            first_row = int(match.group(1))
+            for offset, row_id in enumerate(app_ids):
+                self._id_row_cache[(sheet_name, row_id)] = first_row + offset
 
-        return app_id
+        return app_ids
 
     # ---------------------------------------------------------
     # UPDATE AFTER SEND (UPDATED)
     # ---------------------------------------------------------
-    def update_application_sent(self, app_id: str, language: str, body: str, cv_filename: str):
-        """Update sheet after email is successfully sent."""
-        sheet_name = self._get_sheet_name(language)
-
-        row_index = self._find_row_by_id(sheet_name, app_id)
-        if not row_index:
-            raise ValueError(f"Application ID {app_id} not found")
-
+    def _sent_updates(self, sheet_name: str, row_index: int, body: str, cv_filename: str) -> List[Dict[str, Any]]:
+        """Build the value ranges that mark an application as sent."""
         sent_date = get_current_timestamp()
         next_followup = calculate_next_followup(sent_date)
 
-        updates = [
+        return [
             {"range": f"{sheet_name}!E{row_index}", "values": [["Sent"]]},
             {"range": f"{sheet_name}!F{row_index}", "values": [[sent_date]]},
             {"range": f"{sheet_name}!H{row_index}", "values": [[next_followup]]},
@@ -206,6 +329,16 @@ class SheetsClient:
             {"range": f"{sheet_name}!L{row_index}", "values": [[cv_filename]]},
         ]
 
+    def update_application_sent(self, app_id: str, language: str, body: str, cv_filename: str):
+        """Update sheet after email is successfully sent."""
+        sheet_name = self._get_sheet_name(language)
+
+        row_index = self._find_row_by_id(sheet_name, app_id)
+        if not row_index:
+            raise ValueError(f"Application ID {app_id} not found")
+
+        updates = self._sent_updates(sheet_name, row_index, body, cv_filename)
+
         self._execute_sheets_api(
             'batch_update_application_sent',
             lambda: self.service.spreadsheets().values().batchUpdate(
@@ -263,6 +396,96 @@ class SheetsClient:
             ).execute()
         )
 
+    # Column letters of the cells the web UI edits in place
+    EDITABLE_COLUMNS = {"company": "B", "email": "C", "body": "K"}
+
+    def update_application_cells(self, app_id: str, language: str, updates: Dict[str, str]) -> bool:
+        """Update one or more editable cells of a row in a single write.
+
+        Every field lands in the same values.batchUpdate, so editing N
+        fields costs one round-trip and one write-quota unit instead of N.
+        Returns False when the row or every requested field is unknown.
+        """
+        sheet_name = self._get_sheet_name(language)
+
+        row_index = self._find_row_by_id(sheet_name, app_id)
+        if not row_index:
+            return False
+
+        data = [
+            {
+                "range": f"{sheet_name}!{self.EDITABLE_COLUMNS[field]}{row_index}",
+                "values": [[value]]
+            }
+            for field, value in updates.items()
+            if field in self.EDITABLE_COLUMNS
+        ]
+
+        if not data:
+            return False
+
+        self._execute_sheets_api(
+            'update_application_cells',
+            lambda: self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={"valueInputOption": "RAW", "data": data}
+            ).execute()
+        )
+
+        return True
+
+    def delete_applications(self, app_ids: List[str], language: str) -> int:
+        """Delete application rows in a single batchUpdate.
+
+        The deleteDimension requests are ordered by descending row index
+        so earlier deletions in the batch don't shift the rows targeted
+        by later ones. Unknown ids are skipped and duplicate ids collapse
+        to one deletion — repeating a row would delete whatever shifted
+        into its place. Returns the number of rows actually deleted.
+        """
+        sheet_name = self._get_sheet_name(language)
+
+        rows = []
+        for app_id in app_ids:
+            row_index = self._find_row_by_id(sheet_name, app_id)
+            if row_index:
+                rows.append(row_index)
+
+        if not rows:
+            return 0
+
+        sheet_id = self._get_sheet_id(sheet_name)
+        if sheet_id is None:
+            return 0
+
+        rows = sorted(set(rows), reverse=True)
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "dimension": "ROWS",
+                        "startIndex": row - 1,
+                        "endIndex": row
+                    }
+                }
+            }
+            for row in rows
+        ]
+
+        self._execute_sheets_api(
+            'delete_application_rows',
+            lambda: self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={"requests": requests}
+            ).execute()
+        )
+
+        # Row positions below the deleted rows have shifted
+        self._drop_row_cache(sheet_name)
+
+        return len(rows)
+
     # ---------------------------------------------------------
     # RETRIEVE FOLLOWUP-DUE APPLICATIONS (UPDATED)
     # ---------------------------------------------------------
@@ -278,7 +501,35 @@ class SheetsClient:
             ).execute()
         )
 
-        rows = result.get("values", [])
+        return self._parse_followup_rows(result.get("values", []), language)
+
+    def get_applications_for_followup_multi(self, languages: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch follow-up applications for several languages in one call.
+
+        Uses values.batchGet so EN + FR cost a single HTTPS round-trip
+        (and one quota unit) instead of one per language.
+        """
+        ranges = [f"{self._get_sheet_name(lang)}!A2:Q" for lang in languages]
+
+        result = self._execute_sheets_api(
+            'get_applications_for_followup_multi',
+            lambda: self.service.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=ranges
+            ).execute()
+        )
+
+        value_ranges = result.get("valueRanges", [])
+        return {
+            lang: self._parse_followup_rows(
+                value_ranges[i].get("values", []) if i < len(value_ranges) else [],
+                lang
+            )
+            for i, lang in enumerate(languages)
+        }
+
+    def _parse_followup_rows(self, rows: List[List], language: str) -> List[Dict[str, Any]]:
+        """Turn raw sheet rows into the application dicts callers expect."""
         applications = []
 
         for row in rows:
@@ -322,22 +573,153 @@ class SheetsClient:
     # ACTIVITY LOG
     # ---------------------------------------------------------
     def log_activity(self, app_id: str, email: str, action: str, result: str, details: str = ""):
-        """Append an activity log entry."""
+        """Record an activity log entry.
+
+        The row lands in the local JSONL mirror immediately (microseconds),
+        then a daemon thread pushes it to the Activity sheet so callers are
+        never blocked on a Sheets round-trip or a rate-limit storm.
+        """
         timestamp = get_current_timestamp()
 
         row = [timestamp, app_id, email, action, result, details]
 
-        self._execute_sheets_api(
-            'append_activity_log',
-            lambda: self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{SHEET_ACTIVITY}!A:F",
-                valueInputOption="RAW",
-                insertDataOption="INSERT_ROWS",
-                body={"values": [row]}
-            ).execute()
+        self._append_activity_jsonl(row)
+        self._activity_queue.put(row)
+        self._ensure_activity_worker()
+
+    def _append_activity_jsonl(self, row: List[Any]):
+        """Append a row to the local activity mirror (best effort)."""
+        try:
+            ACTIVITY_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(ACTIVITY_LOG_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(dict(zip(ACTIVITY_LOG_COLUMNS, row)), ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"[WARN] Failed to write local activity log: {e}")
+
+    def _ensure_activity_worker(self):
+        if self._activity_worker is None or not self._activity_worker.is_alive():
+            self._activity_worker = threading.Thread(
+                target=self._drain_activity_queue,
+                name="activity-log-drain",
+                daemon=True
+            )
+            self._activity_worker.start()
+
+    def _drain_activity_queue(self):
+        while True:
+            row = self._activity_queue.get()
+            try:
+                self._execute_sheets_api(
+                    'append_activity_log',
+                    lambda: self.service.spreadsheets().values().append(
+                        spreadsheetId=self.spreadsheet_id,
+                        range=f"{SHEET_ACTIVITY}!A:F",
+                        valueInputOption="RAW",
+                        insertDataOption="INSERT_ROWS",
+                        body={"values": [row]}
+                    ).execute()
+                )
+            except Exception:
+                # Already reported by _execute_sheets_api; the row remains
+                # durable in the local JSONL mirror.
+                pass
+            finally:
+                self._activity_queue.task_done()
+
+    # ---------------------------------------------------------
+    # BUFFERED WRITES
+    # ---------------------------------------------------------
+    def queue_update_application_sent(self, app_id: str, language: str, body: str, cv_filename: str):
+        """Buffer the 'sent' updates for a row; shipped by the next flush()."""
+        sheet_name = self._get_sheet_name(language)
+
+        row_index = self._find_row_by_id(sheet_name, app_id)
+        if not row_index:
+            raise ValueError(f"Application ID {app_id} not found")
+
+        self._pending_value_updates.extend(
+            self._sent_updates(sheet_name, row_index, body, cv_filename)
         )
 
+    def queue_update_application_followup(
+        self,
+        app_id: str,
+        language: str,
+        followup_count: int,
+        last_followup_date: Optional[str] = None
+    ):
+        """Buffer the follow-up bookkeeping for a row; shipped by flush().
+
+        Callers that already hold the row (the follow-up engine iterates
+        parsed rows) pass last_followup_date to skip the per-row cell
+        read the immediate update_application_followup performs.
+        """
+        sheet_name = self._get_sheet_name(language)
+
+        row_index = self._find_row_by_id(sheet_name, app_id)
+        if not row_index:
+            raise ValueError(f"Application ID {app_id} not found")
+
+        if last_followup_date is None:
+            last_followup_date = self._get_cell_value(sheet_name, row_index, 8)
+        next_followup = calculate_next_followup(last_followup_date)
+
+        self._pending_value_updates.extend([
+            {"range": f"{sheet_name}!G{row_index}", "values": [[followup_count]]},
+            {"range": f"{sheet_name}!H{row_index}", "values": [[next_followup]]},
+            {"range": f"{sheet_name}!E{row_index}", "values": [["Follow-up Sent"]]},
+        ])
+
+    def queue_log_activity(self, app_id: str, email: str, action: str, result: str, details: str = ""):
+        """Buffer an activity log entry; shipped by the next flush()."""
+        timestamp = get_current_timestamp()
+        self._pending_activity_rows.append(
+            [timestamp, app_id, email, action, result, details]
+        )
+
+    def flush(self):
+        """Ship all buffered writes: one batchUpdate plus one append.
+
+        A failed batch is put back at the front of its buffer so a later
+        flush can retry it — the queued updates are bookkeeping for emails
+        that already went out, and dropping them would make the next run
+        re-send to everyone. Also waits for the background activity drain
+        so a CLI process doesn't exit with rows still queued for Sheets.
+        """
+        if self._pending_value_updates:
+            data, self._pending_value_updates = self._pending_value_updates, []
+            try:
+                self._execute_sheets_api(
+                    'flush_value_updates',
+                    lambda: self.service.spreadsheets().values().batchUpdate(
+                        spreadsheetId=self.spreadsheet_id,
+                        body={"data": data, "valueInputOption": "RAW"}
+                    ).execute()
+                )
+            except Exception:
+                self._pending_value_updates = data + self._pending_value_updates
+                raise
+
+        if self._pending_activity_rows:
+            rows, self._pending_activity_rows = self._pending_activity_rows, []
+            try:
+                self._execute_sheets_api(
+                    'flush_activity_log',
+                    lambda: self.service.spreadsheets().values().append(
+                        spreadsheetId=self.spreadsheet_id,
+                        range=f"{SHEET_ACTIVITY}!A:F",
+                        valueInputOption="RAW",
+                        insertDataOption="INSERT_ROWS",
+                        body={"values": rows}
+                    ).execute()
+                )
+            except Exception:
+                self._pending_activity_rows = rows + self._pending_activity_rows
+                raise
+
+        if self._activity_worker is not None and self._activity_worker.is_alive():
+            self._activity_queue.join()
+
     # ---------------------------------------------------------
     # LOOKUP HELPERS (UPDATED)
     # ---------------------------------------------------------
@@ -378,8 +760,26 @@ class SheetsClient:
 
         return None
 
+    def _cache_row_from_append(self, sheet_name: str, row_id: str, resp: Dict[str, Any]):
+        """Parse the row index out of an append response's updatedRange."""
+        updated_range = (resp or {}).get("updates", {}).get("updatedRange", "")
+        match = re.search(r"!A(\d+)", updated_range)
+        if match:
+            self._id_row_cache[(sheet_name, row_id)] = int(match.group(1))
+
+    def _drop_row_cache(self, sheet_name: str):
+        """Forget cached row indices for a sheet (row positions shifted)."""
+        self._id_row_cache = {
+            key: row for key, row in self._id_row_cache.items()
+            if key[0] != sheet_name
+        }
+
     def _find_row_by_id(self, sheet_name: str, app_id: str) -> Optional[int]:
         """Find row index (1-based) for a given ID."""
+        cached = self._id_row_cache.get((sheet_name, app_id))
+        if cached:
+            return cached
+
         result = self._execute_sheets_api(
             'find_row_by_id',
             lambda: self.service.spreadsheets().values().get(
@@ -390,6 +790,7 @@ class SheetsClient:
 
         for i, row in enumerate(result.get("values", []), start=1):
             if row and row[0] == app_id:
+                self._id_row_cache[(sheet_name, app_id)] = i
                 return i
 
         return None
@@ -519,7 +920,7 @@ class SheetsClient:
             added_date  # Last Updated
         ]
 
-        self._execute_sheets_api(
+        resp = self._execute_sheets_api(
             'add_company',
             lambda: self.service.spreadsheets().values().append(
                 spreadsheetId=self.spreadsheet_id,
@@ -530,6 +931,9 @@ class SheetsClient:
             ).execute()
         )
 
+        self._cache_row_from_append(SHEET_COMPANIES, company_id, resp)
+        self._companies_by_name_lower = None  # name index is stale
+
         return company_id
 
     def get_all_companies(self) -> List[Dict[str, Any]]:
@@ -545,8 +949,9 @@ class SheetsClient:
 
             rows = result.get("values", [])
             companies = []
+            name_index: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
-            for row in rows:
+            for row_index, row in enumerate(rows, start=2):
                 if len(row) < 2 or not row[0] or not row[1]:
                     continue
 
@@ -565,18 +970,32 @@ class SheetsClient:
                     "last_updated": row[11] if len(row) > 11 else ""
                 })
 
+                company = companies[-1]
+                name_index[company["name"].lower()] = (row_index, company)
+                self._id_row_cache[(SHEET_COMPANIES, company["id"])] = row_index
+
+            self._companies_by_name_lower = name_index
             return companies
         except Exception as e:
             print(f"[ERROR] Failed to get companies: {e}")
             return []
 
+    def _find_company_row_and_record(self, company_name: str) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """Return (row_index, company_dict) for a name, or (None, None).
+
+        Serves from the name index when available; otherwise one combined
+        fetch via get_all_companies rebuilds it.
+        """
+        if self._companies_by_name_lower is None:
+            self.get_all_companies()
+
+        hit = (self._companies_by_name_lower or {}).get(company_name.lower())
+        return hit if hit else (None, None)
+
     def get_company_by_name(self, company_name: str) -> Optional[Dict[str, Any]]:
         """Find a company by name (case-insensitive)."""
-        companies = self.get_all_companies()
-        for company in companies:
-            if company["name"].lower() == company_name.lower():
-                return company
-        return None
+        _, company = self._find_company_row_and_record(company_name)
+        return company
 
     def get_company_by_id(self, company_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific company by ID."""
@@ -597,20 +1016,21 @@ class SheetsClient:
         location: Optional[str] = None,
         reference: Optional[str] = None,
         salary_range: Optional[str] = None,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        row_index: Optional[int] = None
     ) -> bool:
-        """Update a company's information."""
-        row_index = self._find_row_by_id(SHEET_COMPANIES, company_id)
+        """Update a company's information.
+
+        Callers that already know the row index (e.g. via
+        _find_company_row_and_record) can pass it to skip the lookup.
+        """
+        if row_index is None:
+            row_index = self._find_row_by_id(SHEET_COMPANIES, company_id)
         if not row_index:
             return False
 
         last_updated = get_current_timestamp()
 
-        # Get current values
-        current = self.get_company_by_id(company_id)
-        if not current:
-            return False
-
         # Prepare updates
         updates = []
         if company_name is not None:
@@ -644,6 +1064,8 @@ class SheetsClient:
                 ).execute()
             )
 
+        self._companies_by_name_lower = None  # cached records are stale
+
         return True
 
     def upsert_company_from_application(
@@ -665,7 +1087,7 @@ class SheetsClient:
         normalized_emails = [e.strip() for e in emails if e.strip()]
         email_string = ", ".join(dict.fromkeys([e for e in normalized_emails]))
 
-        existing = self.get_company_by_name(company_name)
+        row_index, existing = self._find_company_row_and_record(company_name)
         if existing:
             merged_emails = self._merge_emails(existing.get("email", ""), normalized_emails)
             self.update_company(
@@ -678,7 +1100,8 @@ class SheetsClient:
                 location=location or existing.get("location", ""),
                 reference=reference or existing.get("reference", ""),
                 salary_range=salary_range or existing.get("salary_range", ""),
-                notes=notes or existing.get("notes", "")
+                notes=notes or existing.get("notes", ""),
+                row_index=row_index
             )
             return existing["id"]
 
@@ -706,20 +1129,7 @@ class SheetsClient:
         if not row_index:
             return False
 
-        # Get sheetId dynamically
-        spreadsheet = self._execute_sheets_api(
-            'get_spreadsheet',
-            lambda: self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
-            ).execute()
-        )
-
-        sheet_id = None
-        for sheet in spreadsheet["sheets"]:
-            if sheet["properties"]["title"] == SHEET_COMPANIES:
-                sheet_id = sheet["properties"]["sheetId"]
-                break
-
+        sheet_id = self._get_sheet_id(SHEET_COMPANIES)
         if sheet_id is None:
             return False
 
@@ -742,4 +1152,8 @@ class SheetsClient:
             ).execute()
         )
 
+        # Row positions below the deleted row have shifted
+        self._drop_row_cache(SHEET_COMPANIES)
+        self._companies_by_name_lower = None
+
         return True
@@ -1,8 +1,144 @@
-from typing import Dict, Optional
+import atexit
+import copy
+import os
+import threading
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 import json
 from src.config import PROJECT_ROOT
 
+# Coalescing window for disk writes: batch edits within this many seconds
+# land in a single rewrite of templates.json instead of one per mutation.
+SAVE_DEBOUNCE_SECONDS = 1.0
+
+try:
+    import orjson  # C-native JSON; optional fast path
+except ImportError:
+    orjson = None
+
+
+# Built once at import time; instances deep-copy it only on the cold-start
+# path (missing templates.json), so construction stays cheap on warm paths.
+# The MappingProxyType wrapper makes the shared constant read-only so no
+# caller can mutate the defaults that every instance copies from.
+_DEFAULT_TEMPLATES = MappingProxyType({
+    "application": {
+        "instrumentation_en": {
+            "name": "Instrumentation Engineer – Targeted (EN)",
+            "language": "en",
+            "position": "Instrumentation Engineer",
+            "is_default": True,
+            "body": (
+                "Dear Hiring Manager,\n\n"
+                "I am excited to apply for the [Position] role at [Company]. "
+                "My hands-on experience with PLC programming, SCADA/HMI systems, "
+                "and field instrumentation aligns strongly with industrial operations "
+                "and safety-critical environments.\n\n"
+                "During my internship at Sonatrach (GL1K), I redesigned an industrial "
+                "air dryer control system using Siemens TIA Portal and WinCC. "
+                "This redesign resolved pressure instability and synchronization faults, "
+                "resulting in a 20% improvement in compressed air quality and a 15% "
+                "reduction in system downtime. The project was validated and formalized "
+                "as my engineering thesis.\n\n"
+                "I have practical experience with HART-based calibration, loop checks, "
+                "FAT/SAT support, and interpreting P&IDs and ISA-compliant control diagrams. "
+                "I am comfortable working in field conditions and collaborating closely "
+                "with operations, maintenance, and safety teams.\n\n"
+                "Fluent in Arabic, English, and French, I communicate effectively across "
+                "technical and multicultural environments. I am available immediately "
+                "and highly motivated to contribute to [Company]'s standards of "
+                "operational excellence and safe field performance.\n\n"
+                "Sincerely,\n"
+                "Aimen Berkane"
+            ),
+        },
+
+        "instrumentation_fr": {
+            "name": "Ingénieur Instrumentation – Ciblé (FR)",
+            "language": "fr",
+            "position": "Ingénieur Instrumentation",
+            "is_default": True,
+            "body": (
+                "Madame, Monsieur,\n\n"
+                "Je souhaite vous présenter ma candidature au poste de [Position] au sein "
+                "de [Company]. Mon expérience pratique en instrumentation industrielle, "
+                "automatisme (PLC) et systèmes SCADA/HMI correspond étroitement aux "
+                "exigences des environnements industriels et pétroliers.\n\n"
+                "Lors de mon stage chez Sonatrach (GL1K), j'ai réalisé la refonte complète "
+                "du système de contrôle d'un sécheur d'air industriel à l'aide de Siemens "
+                "TIA Portal et WinCC. Cette intervention a permis de corriger des "
+                "instabilités de pression et des défauts de synchronisation, entraînant "
+                "une amélioration de 20 % de la qualité de l'air comprimé et une réduction "
+                "de 15 % des arrêts système. Ce travail a été validé comme projet de fin "
+                "d'études.\n\n"
+                "Je dispose d'une expérience terrain en calibration HART, loop checking, "
+                "assistance FAT/SAT ainsi qu'en lecture et interprétation des schémas P&ID "
+                "et normes ISA. Je suis à l'aise dans les environnements de terrain et le "
+                "travail en coordination avec les équipes exploitation, maintenance et "
+                "sécurité.\n\n"
+                "Trilingue (arabe, anglais, français), je m'intègre efficacement dans des "
+                "équipes techniques multiculturelles. Disponible immédiatement, je suis "
+                "motivé à contribuer aux standards de performance et de sécurité de "
+                "[Company].\n\n"
+                "Cordialement,\n"
+                "Aimen Berkane"
+            ),
+        },
+    },
+
+    "followup": {
+        "polite_en": {
+            "name": "Follow-up – Polite (EN)",
+            "language": "en",
+            "is_default": True,
+            "body": (
+                "Dear Hiring Manager,\n\n"
+                "I hope you are doing well. I am writing to follow up on my application "
+                "for the [Position] role at [Company], submitted on [Date].\n\n"
+                "I remain very interested in this opportunity and would welcome the "
+                "chance to discuss how my background could support your team.\n\n"
+                "Thank you for your time and consideration.\n\n"
+                "Best regards,\n"
+                "Aimen Berkane"
+            ),
+        },
+
+        "assertive_en": {
+            "name": "Follow-up – Assertive (EN)",
+            "language": "en",
+            "is_default": False,
+            "body": (
+                "Dear Hiring Manager,\n\n"
+                "I am following up regarding my application for the [Position] role at "
+                "[Company]. I am highly enthusiastic about the opportunity and confident "
+                "that my technical background aligns well with your requirements.\n\n"
+                "I would appreciate an update on the hiring process and next steps. "
+                "Please let me know if any additional information is needed.\n\n"
+                "Kind regards,\n"
+                "Aimen Berkane"
+            ),
+        },
+
+        "polite_fr": {
+            "name": "Follow-up – Poli (FR)",
+            "language": "fr",
+            "is_default": True,
+            "body": (
+                "Madame, Monsieur,\n\n"
+                "J'espère que vous allez bien. Je me permets de revenir vers vous "
+                "concernant ma candidature pour le poste de [Position] chez [Company].\n\n"
+                "Je reste très intéressé par cette opportunité et serais ravi de "
+                "pouvoir échanger avec vous sur la façon dont mon expérience pourrait "
+                "contribuer à votre équipe.\n\n"
+                "Je vous remercie de votre attention.\n\n"
+                "Cordialement,\n"
+                "Aimen Berkane"
+            ),
+        },
+    },
+})
+
 
 class TemplateManager:
     def __init__(self):
@@ -10,143 +146,124 @@ class TemplateManager:
         self.templates_dir.mkdir(exist_ok=True)
 
         self.templates_file = self.templates_dir / "templates.json"
-        self._load_templates()
+
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # One manager is shared by every request thread (the template
+        # endpoints are sync defs running on Starlette's threadpool) plus
+        # the debounce timer and atexit hook. Reentrant because the
+        # public methods take it and then read the templates property,
+        # which takes it again.
+        self._lock = threading.RLock()
+
+        # Parsed lazily on first access so constructing a manager that is
+        # never read (e.g. app startup) doesn't pay the JSON parse.
+        self._templates: Optional[Dict] = None
+
+        # Flat (category, template_id) -> template map so get_template is a
+        # single dict lookup instead of two chained .get() calls.
+        self._flat: Optional[Dict[Tuple[str, str], Dict]] = None
+
+        # (category, language) -> template_id of the default template, so
+        # get_default_template doesn't re-scan the category per call.
+        self._default_index: Optional[Dict[Tuple[str, str], str]] = None
+
+        # Memoized read-only views handed out by get_default_template, so
+        # the {**template, 'id': ...} merge is built once per default.
+        self._default_views: Dict[Tuple[str, str], Dict] = {}
+
+        # mtime of templates.json when it was last parsed; lets reads spot
+        # out-of-band edits with one stat() instead of re-parsing per call.
+        self._loaded_mtime: Optional[float] = None
+
+        # Make sure a pending debounced save isn't lost on interpreter exit
+        atexit.register(self.flush)
+
+    @property
+    def templates(self) -> Dict:
+        with self._lock:
+            if self._templates is None:
+                self._load_templates()
+            elif not self._dirty:
+                # File may have been edited outside this process; a stat() per
+                # access is far cheaper than the reparse it occasionally triggers.
+                # Skipped while dirty so a pending debounced save isn't clobbered.
+                try:
+                    mtime = os.path.getmtime(self.templates_file)
+                except OSError:
+                    mtime = None
+                if mtime is not None and mtime != self._loaded_mtime:
+                    self._invalidate_indexes()
+                    self._load_templates()
+            return self._templates
+
+    def _invalidate_indexes(self):
+        """Drop derived lookup structures after the backing dict changes."""
+        self._flat = None
+        self._default_index = None
+        self._default_views = {}
 
     # ------------------------------------------------------------------
     # INTERNAL LOAD / SAVE
     # ------------------------------------------------------------------
     def _load_templates(self):
         if self.templates_file.exists():
-            with open(self.templates_file, "r", encoding="utf-8") as f:
-                self.templates = json.load(f)
+            raw = self.templates_file.read_bytes()
+            if orjson is not None:
+                self._templates = orjson.loads(raw)
+            else:
+                self._templates = json.loads(raw.decode("utf-8"))
+            self._loaded_mtime = os.path.getmtime(self.templates_file)
         else:
-            self.templates = self._get_default_templates()
+            self._templates = self._get_default_templates()
             self._save_templates()
 
     def _save_templates(self):
-        with open(self.templates_file, "w", encoding="utf-8") as f:
-            json.dump(self.templates, f, indent=2, ensure_ascii=False)
+        # Write to a temp file then rename so a crash mid-write can't
+        # leave a torn templates.json behind.
+        tmp_file = self.templates_file.with_suffix(".json.tmp")
+
+        if orjson is not None:
+            # orjson always emits UTF-8 without the ensure_ascii scan
+            tmp_file.write_bytes(
+                orjson.dumps(self.templates, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.templates, f, indent=2, ensure_ascii=False)
+
+        os.replace(tmp_file, self.templates_file)
+        self._loaded_mtime = os.path.getmtime(self.templates_file)
+        self._dirty = False
+
+    def _schedule_save(self):
+        """Mark templates dirty and (re)start the debounced flush timer."""
+        self._dirty = True
+
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+
+        self._flush_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self):
+        """Persist pending template edits, if any."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if self._dirty:
+                self._save_templates()
 
     # ------------------------------------------------------------------
     # DEFAULT TEMPLATES
     # ------------------------------------------------------------------
     def _get_default_templates(self) -> Dict:
-        return {
-            "application": {
-                "instrumentation_en": {
-                    "name": "Instrumentation Engineer – Targeted (EN)",
-                    "language": "en",
-                    "position": "Instrumentation Engineer",
-                    "is_default": True,
-                    "body": (
-                        "Dear Hiring Manager,\n\n"
-                        "I am excited to apply for the [Position] role at [Company]. "
-                        "My hands-on experience with PLC programming, SCADA/HMI systems, "
-                        "and field instrumentation aligns strongly with industrial operations "
-                        "and safety-critical environments.\n\n"
-                        "During my internship at Sonatrach (GL1K), I redesigned an industrial "
-                        "air dryer control system using Siemens TIA Portal and WinCC. "
-                        "This redesign resolved pressure instability and synchronization faults, "
-                        "resulting in a 20% improvement in compressed air quality and a 15% "
-                        "reduction in system downtime. The project was validated and formalized "
-                        "as my engineering thesis.\n\n"
-                        "I have practical experience with HART-based calibration, loop checks, "
-                        "FAT/SAT support, and interpreting P&IDs and ISA-compliant control diagrams. "
-                        "I am comfortable working in field conditions and collaborating closely "
-                        "with operations, maintenance, and safety teams.\n\n"
-                        "Fluent in Arabic, English, and French, I communicate effectively across "
-                        "technical and multicultural environments. I am available immediately "
-                        "and highly motivated to contribute to [Company]'s standards of "
-                        "operational excellence and safe field performance.\n\n"
-                        "Sincerely,\n"
-                        "Aimen Berkane"
-                    ),
-                },
-
-                "instrumentation_fr": {
-                    "name": "Ingénieur Instrumentation – Ciblé (FR)",
-                    "language": "fr",
-                    "position": "Ingénieur Instrumentation",
-                    "is_default": True,
-                    "body": (
-                        "Madame, Monsieur,\n\n"
-                        "Je souhaite vous présenter ma candidature au poste de [Position] au sein "
-                        "de [Company]. Mon expérience pratique en instrumentation industrielle, "
-                        "automatisme (PLC) et systèmes SCADA/HMI correspond étroitement aux "
-                        "exigences des environnements industriels et pétroliers.\n\n"
-                        "Lors de mon stage chez Sonatrach (GL1K), j'ai réalisé la refonte complète "
-                        "du système de contrôle d'un sécheur d'air industriel à l'aide de Siemens "
-                        "TIA Portal et WinCC. Cette intervention a permis de corriger des "
-                        "instabilités de pression et des défauts de synchronisation, entraînant "
-                        "une amélioration de 20 % de la qualité de l'air comprimé et une réduction "
-                        "de 15 % des arrêts système. Ce travail a été validé comme projet de fin "
-                        "d'études.\n\n"
-                        "Je dispose d'une expérience terrain en calibration HART, loop checking, "
-                        "assistance FAT/SAT ainsi qu'en lecture et interprétation des schémas P&ID "
-                        "et normes ISA. Je suis à l'aise dans les environnements de terrain et le "
-                        "travail en coordination avec les équipes exploitation, maintenance et "
-                        "sécurité.\n\n"
-                        "Trilingue (arabe, anglais, français), je m'intègre efficacement dans des "
-                        "équipes techniques multiculturelles. Disponible immédiatement, je suis "
-                        "motivé à contribuer aux standards de performance et de sécurité de "
-                        "[Company].\n\n"
-                        "Cordialement,\n"
-                        "Aimen Berkane"
-                    ),
-                },
-            },
-
-            "followup": {
-                "polite_en": {
-                    "name": "Follow-up – Polite (EN)",
-                    "language": "en",
-                    "is_default": True,
-                    "body": (
-                        "Dear Hiring Manager,\n\n"
-                        "I hope you are doing well. I am writing to follow up on my application "
-                        "for the [Position] role at [Company], submitted on [Date].\n\n"
-                        "I remain very interested in this opportunity and would welcome the "
-                        "chance to discuss how my background could support your team.\n\n"
-                        "Thank you for your time and consideration.\n\n"
-                        "Best regards,\n"
-                        "Aimen Berkane"
-                    ),
-                },
-
-                "assertive_en": {
-                    "name": "Follow-up – Assertive (EN)",
-                    "language": "en",
-                    "is_default": False,
-                    "body": (
-                        "Dear Hiring Manager,\n\n"
-                        "I am following up regarding my application for the [Position] role at "
-                        "[Company]. I am highly enthusiastic about the opportunity and confident "
-                        "that my technical background aligns well with your requirements.\n\n"
-                        "I would appreciate an update on the hiring process and next steps. "
-                        "Please let me know if any additional information is needed.\n\n"
-                        "Kind regards,\n"
-                        "Aimen Berkane"
-                    ),
-                },
-
-                "polite_fr": {
-                    "name": "Follow-up – Poli (FR)",
-                    "language": "fr",
-                    "is_default": True,
-                    "body": (
-                        "Madame, Monsieur,\n\n"
-                        "J'espère que vous allez bien. Je me permets de revenir vers vous "
-                        "concernant ma candidature pour le poste de [Position] chez [Company].\n\n"
-                        "Je reste très intéressé par cette opportunité et serais ravi de "
-                        "pouvoir échanger avec vous sur la façon dont mon expérience pourrait "
-                        "contribuer à votre équipe.\n\n"
-                        "Je vous remercie de votre attention.\n\n"
-                        "Cordialement,\n"
-                        "Aimen Berkane"
-                    ),
-                },
-            },
-        }
+        # dict() unwraps the read-only proxy so deepcopy can do its work
+        return copy.deepcopy(dict(_DEFAULT_TEMPLATES))
 
     # ------------------------------------------------------------------
     # PUBLIC API
@@ -157,31 +274,69 @@ class TemplateManager:
         return self.templates
 
     def get_template(self, category: str, template_id: str) -> Optional[Dict]:
-        return self.templates.get(category, {}).get(template_id)
+        with self._lock:
+            templates = self.templates  # property runs the staleness check
+            if self._flat is None:
+                self._flat = {
+                    (cat, tid): tmpl
+                    for cat, cat_templates in templates.items()
+                    for tid, tmpl in cat_templates.items()
+                }
+            return self._flat.get((category, template_id))
 
     def get_default_template(self, category: str, language: str) -> Optional[Dict]:
         """Get the default template for a specific category and language."""
-        templates = self.templates.get(category, {})
-        for template_id, template in templates.items():
-            if template.get('language') == language and template.get('is_default', False):
-                return {**template, 'id': template_id}
-        return None
+        with self._lock:
+            templates = self.templates  # property runs the staleness check
+            if self._default_index is None:
+                self._default_index = {
+                    (cat, tmpl.get('language')): tid
+                    for cat, cat_templates in templates.items()
+                    for tid, tmpl in cat_templates.items()
+                    if tmpl.get('is_default', False)
+                }
+
+            template_id = self._default_index.get((category, language))
+            if template_id is None:
+                return None
+
+            view = self._default_views.get((category, language))
+            if view is None:
+                template = self.templates.get(category, {}).get(template_id)
+                if template is None:
+                    return None
+                # Read-only so the shared memoized view can't be mutated by a
+                # caller and leak into later reads
+                view = MappingProxyType({**template, 'id': template_id})
+                self._default_views[(category, language)] = view
+
+            return view
 
     def save_template(self, category: str, template_id: str, template_data: Dict):
-        if category not in self.templates:
-            self.templates[category] = {}
+        with self._lock:
+            if category not in self.templates:
+                self.templates[category] = {}
 
-        # If setting as default, remove default flag from other templates with same language
-        if template_data.get('is_default', False):
-            language = template_data.get('language')
-            for tid, tmpl in self.templates[category].items():
-                if tmpl.get('language') == language and tid != template_id:
-                    self.templates[category][tid]['is_default'] = False
+            # If setting as default, remove default flag from other templates with same language
+            if template_data.get('is_default', False):
+                language = template_data.get('language')
+                for tid, tmpl in self.templates[category].items():
+                    if tmpl.get('language') == language and tid != template_id:
+                        self.templates[category][tid]['is_default'] = False
 
-        self.templates[category][template_id] = template_data
-        self._save_templates()
+            self.templates[category][template_id] = template_data
+            if self._flat is not None:
+                self._flat[(category, template_id)] = template_data
+            self._default_index = None  # default flags may have moved
+            self._default_views = {}
+            self._schedule_save()
 
     def delete_template(self, category: str, template_id: str):
-        if category in self.templates and template_id in self.templates[category]:
-            del self.templates[category][template_id]
-            self._save_templates()
\ No newline at end of file
+        with self._lock:
+            if category in self.templates and template_id in self.templates[category]:
+                del self.templates[category][template_id]
+                if self._flat is not None:
+                    self._flat.pop((category, template_id), None)
+                self._default_index = None
+                self._default_views = {}
+                self._schedule_save()
\ No newline at end of file
@@ -1,14 +1,15 @@
 import typer
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from rich.console import Console
-from rich.table import Table
-from rich.prompt import Confirm
-
-from src.auth import get_authenticated_services
-from src.sheets import SheetsClient
-from src.mailer import GmailMailer
-from src.attachments import AttachmentSelector
-from src.followup import FollowupEngine
+
+# rich.progress / rich.table / rich.prompt are imported inside the commands
+# that render them, so plain invocations don't pay for widgets they never
+# draw.
+
+# The Google client stack (src.auth, src.sheets, src.mailer) drags in
+# googleapiclient + oauth libraries; it is imported inside get_clients()
+# so `--help` and argument errors never pay for it.
 from src.utils import (
     validate_email, get_default_body, get_default_position,
     substitute_placeholders
@@ -18,19 +19,41 @@ from src.utils import (
 app = typer.Typer(help="Job Application Automation CLI")
 console = Console()
 
+# Concurrent sends per language batch. Kept low on purpose: each worker
+# still applies its own send_with_delay jitter, and a wider pool would
+# look like a burst to Gmail.
+SEND_WORKERS = 3
+
 
 # ---------------------------------------------------------
 # CLIENT INITIALIZATION
 # ---------------------------------------------------------
+_clients = None
+
+
 def get_clients():
-    """Authenticate and initialize Google Sheets + Gmail clients."""
-    gmail_service, sheets_service = get_authenticated_services()
+    """Authenticate and initialize Google Sheets + Gmail clients.
+
+    Authentication and service discovery are paid once per process; every
+    command after the first reuses the same client objects.
+    """
+    global _clients
+
+    if _clients is None:
+        from src.auth import get_authenticated_services
+        from src.sheets import SheetsClient
+        from src.mailer import GmailMailer
+        from src.attachments import AttachmentSelector
+
+        gmail_service, sheets_service = get_authenticated_services()
+
+        sheets_client = SheetsClient(sheets_service)
+        mailer = GmailMailer(gmail_service) if gmail_service else None
+        attachment_selector = AttachmentSelector()
 
-    sheets_client = SheetsClient(sheets_service)
-    mailer = GmailMailer(gmail_service) if gmail_service else None
-    attachment_selector = AttachmentSelector()
+        _clients = (sheets_client, mailer, attachment_selector)
 
-    return sheets_client, mailer, attachment_selector
+    return _clients
 
 
 # ---------------------------------------------------------
@@ -104,10 +127,9 @@ def send(
 
         attachment_filename = attachment_path.name
 
-        # Process each email
-        for recipient in email:
-            console.print(f"\nProcessing {recipient}...")
-
+        # Process each email; the work is network-bound (Gmail + Sheets
+        # round-trips), so recipients are handled by a small worker pool.
+        def send_one(recipient: str) -> str:
             # Add application entry
             app_id = sheets_client.add_application(
                 email=recipient,
@@ -130,27 +152,59 @@ def send(
 
             # Send email
             try:
-                result = mailer.send_with_delay(
+                mailer.send_with_delay(
                     to_email=recipient,
                     subject=final_position,
                     body=final_body,
                     attachment_path=attachment_path
                 )
 
-                sheets_client.update_application_sent(app_id, language, final_body, attachment_filename)
+                # Queue the bookkeeping writes; one flush() after the loop
+                # ships them all in a single batch instead of 2 calls each
+                sheets_client.queue_update_application_sent(app_id, language, final_body, attachment_filename)
 
-                sheets_client.log_activity(
+                sheets_client.queue_log_activity(
                     app_id, recipient, "email_sent", "success", "Initial application sent"
                 )
 
-                console.print(f"[green]✓ Sent to {recipient}[/green]")
+                return f"[green]✓ Sent to {recipient}[/green]"
 
             except Exception as e:
                 sheets_client.update_application_status(app_id, language, "Failed")
                 sheets_client.log_activity(
                     app_id, recipient, "email_failed", "failed", str(e)
                 )
-                console.print(f"[red]✗ Failed to send to {recipient}: {e}[/red]")
+                return f"[red]✗ Failed to send to {recipient}: {e}[/red]"
+
+        # One progress re-render per completed send and a single joined
+        # print at the end, instead of several console.print calls per
+        # recipient.
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        status_lines = []
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                f"Sending {language.upper()} emails...", total=len(email)
+            )
+
+            with ThreadPoolExecutor(max_workers=SEND_WORKERS) as pool:
+                for line in pool.map(send_one, email):
+                    status_lines.append(line)
+                    progress.advance(task)
+
+        console.print("\n".join(status_lines))
+
+    # The emails are already out; a flush failure shouldn't crash the
+    # command — flush() re-queues the batch for a later retry.
+    try:
+        sheets_client.flush()
+    except Exception as e:
+        console.print(f"[red]Failed to flush queued updates (kept for retry): {e}[/red]")
 
     console.print("\n[bold green]Done![/bold green]")
 
@@ -212,9 +266,13 @@ def followups(
         console.print("[red]Invalid language. Use: en, fr, both[/red]")
         raise typer.Exit(1)
 
+    from src.followup import FollowupEngine
+
     engine = FollowupEngine(sheets_client, mailer, attachment_selector)
 
     if not dry_run:
+        from rich.prompt import Confirm
+
         confirm = Confirm.ask("This will send follow-up emails. Continue?")
         if not confirm:
             console.print("[yellow]Cancelled[/yellow]")
@@ -243,6 +301,8 @@ def status(
         console.print(f"[red]Application {app_id} not found in {lang.upper()} sheet[/red]")
         raise typer.Exit(1)
 
+    from rich.table import Table
+
     table = Table(
         title=f"Application {app_id}",
         show_header=True,
@@ -1,17 +1,46 @@
 # src/ui_web.py
 from fastapi import FastAPI, Request, Form, File, UploadFile, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
+from fastapi.responses import JSONResponse as _StdJSONResponse
+
+try:
+    import orjson  # C-native JSON; optional fast path
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    class JSONResponse(_StdJSONResponse):
+        """JSONResponse that encodes with orjson.
+
+        orjson serializes straight to bytes several times faster than the
+        stdlib encoder; every JSONResponse below picks it up via this name.
+        """
+
+        def render(self, content) -> bytes:
+            return orjson.dumps(content)
+else:
+    JSONResponse = _StdJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from typing import List, Optional
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
+import aiofiles
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import heapq
+import operator
 import os
 from datetime import datetime, timedelta
 import pytz
 import sys
+import threading
 import time
 import random
+import re
 import csv
 import io
 
@@ -28,23 +57,44 @@ from src.attachments import AttachmentSelector
 from src.followup import FollowupEngine
 from src.utils import (
     validate_email, get_default_body, get_default_position,
-    substitute_placeholders, is_followup_due, get_default_company,
-    format_timestamp
+    substitute_placeholders, is_followup_due, filter_due,
+    get_default_company, format_timestamp, get_current_timestamp
 )
 from src.analytics import AnalyticsEngine
 from src.templates_manager import TemplateManager
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
 from src.monitoring import system_monitor
 
-app = FastAPI(title="Job Application Automation", version="1.0.0")
+app = FastAPI(
+    title="Job Application Automation",
+    version="1.0.0",
+    default_response_class=JSONResponse,
+)
+
+# Per-IP rate limiting on the endpoints that proxy straight to Sheets
+# writes: a UI burst gets a local 429 instead of burning write quota.
+limiter = Limiter(key_func=get_remote_address)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+# The listing pages (applications, followups) render tens of KB of very
+# repetitive HTML; gzip cuts that roughly 5-10x for anything over 1 KB.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Mount static files
 static_path = PROJECT_ROOT / "static"
 static_path.mkdir(exist_ok=True)
 app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
-# Setup templates
+# Setup templates. auto_reload=False drops the per-render mtime stat and
+# cache_size=-1 keeps every compiled template resident, so a render is a
+# direct call on the cached Template object.
 templates_path = PROJECT_ROOT / "templates"
 templates = Jinja2Templates(directory=str(templates_path))
+templates.env.auto_reload = False
+templates.env.cache = {}  # unbounded, equivalent to cache_size=-1
 
 # Initialize clients (lazy loading)
 _gmail_service = None
@@ -55,24 +105,50 @@ _attachment_selector = None
 _analytics_engine = None
 _template_manager = None
 
+# Guards first-time client construction: without it, concurrent requests
+# hitting a cold cache would each run the multi-second OAuth handshake.
+_clients_lock = threading.Lock()
+
 
 def get_clients():
     global _gmail_service, _sheets_service, _sheets_client, _mailer, _attachment_selector
 
     if _sheets_client is None:
-        _gmail_service, _sheets_service = get_authenticated_services()
-        _sheets_client = SheetsClient(_sheets_service)
-        _mailer = GmailMailer(_gmail_service) if _gmail_service else None
-        _attachment_selector = AttachmentSelector()
+        with _clients_lock:
+            if _sheets_client is None:
+                _gmail_service, _sheets_service = get_authenticated_services()
+                sheets_client = SheetsClient(_sheets_service)
+                _mailer = GmailMailer(_gmail_service) if _gmail_service else None
+                _attachment_selector = AttachmentSelector()
+                # Assigned last so other threads' lock-free fast path
+                # never sees the singleton before its peers exist
+                _sheets_client = sheets_client
 
     return _sheets_client, _mailer, _attachment_selector
 
 
+# Named accessors so handlers pull just the client they use instead of
+# unpacking (and discarding) the full tuple on every request.
+def get_sheets_client() -> SheetsClient:
+    return get_clients()[0]
+
+
+def get_mailer() -> Optional[GmailMailer]:
+    return get_clients()[1]
+
+
+def get_attachment_selector() -> AttachmentSelector:
+    return get_clients()[2]
+
+
 def get_analytics():
     global _analytics_engine
     if _analytics_engine is None:
-        sheets_client, _, _ = get_clients()
-        _analytics_engine = AnalyticsEngine(sheets_client)
+        sheets_client = get_sheets_client()
+        # Feed the engine from the TTL apps cache so each analytics call
+        # reuses the rows every page already fetched instead of issuing
+        # its own EN/FR reads.
+        _analytics_engine = AnalyticsEngine(sheets_client, apps_fetcher=get_apps_cached)
     return _analytics_engine
 
 
@@ -83,6 +159,225 @@ def get_template_manager():
     return _template_manager
 
 
+# ---------------------------------------------------------
+# SHEETS READ CACHE
+# ---------------------------------------------------------
+# Every dashboard view re-reads the whole Applications sheet; the Sheets
+# round-trip dominates page latency. A short TTL keeps navigation between
+# views (and refreshes) served from memory while writes invalidate below.
+CACHE_TTL = 30  # seconds
+
+_apps_cache = {}  # lang -> (monotonic timestamp, rows)
+_statuses_cache = {}  # lang -> sorted distinct statuses, refreshed with the rows
+
+# One lock per language so a burst of concurrent misses triggers a single
+# Sheets fetch instead of one per request (EN and FR still refill in
+# parallel with each other).
+_apps_cache_locks = {'en': threading.Lock(), 'fr': threading.Lock()}
+
+# Shared pool for blocking Google API work dispatched from async handlers,
+# sized above the default so concurrent gathers don't queue behind each
+# other.
+EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+
+def get_apps_cached(lang: str):
+    """Return applications for `lang`, served from a short TTL cache."""
+    cached = _apps_cache.get(lang)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+
+    with _apps_cache_locks[lang]:
+        # Re-check: another thread may have refilled while we waited
+        cached = _apps_cache.get(lang)
+        if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+            return cached[1]
+        return _refresh_apps_cache(lang)
+
+
+def _refresh_apps_cache(lang: str):
+    """Fetch, annotate and store one language's rows. Caller holds the lock."""
+    sheets_client = get_sheets_client()
+    apps = sheets_client.get_applications_for_followup(lang)
+    return _annotate_and_store(lang, apps)
+
+
+def _annotate_and_store(lang: str, apps):
+    # Parse sent_date once per row here, so page handlers don't re-run
+    # datetime.fromisoformat over the same strings on every iteration.
+    # Amortized across all views for the lifetime of the cache entry.
+    for app in apps:
+        sent = app.get('sent_date')
+        try:
+            app['_sent_date_obj'] = datetime.fromisoformat(sent).date() if sent else None
+        except ValueError:
+            app['_sent_date_obj'] = None
+
+    # Derived once per refresh rather than per request: the status filter
+    # dropdown only changes when the underlying rows do.
+    _statuses_cache[lang] = sorted({app.get('status', 'Unknown') for app in apps})
+
+    _apps_cache[lang] = (time.monotonic(), apps)
+    return apps
+
+
+def get_statuses_cached(lang: str):
+    """Distinct statuses for the dropdown, maintained by the apps cache."""
+    get_apps_cached(lang)  # ensures _statuses_cache[lang] is fresh
+    return _statuses_cache.get(lang, [])
+
+
+def get_apps_cached_multi(langs=('en', 'fr')):
+    """Multi-language variant of get_apps_cached.
+
+    Cache hits are served per language; all misses are fetched together
+    through one values.batchGet round-trip instead of one per language.
+    Rows are snapshotted the moment they are known fresh (or fetched), so
+    a concurrent invalidate_apps_cache() popping entries underneath us
+    can't fault the final result.
+    """
+    result = {}
+    now = time.monotonic()
+    for lang in langs:
+        cached = _apps_cache.get(lang)
+        if cached is not None and now - cached[0] < CACHE_TTL:
+            result[lang] = cached[1]
+
+    missing = sorted(l for l in langs if l not in result)
+
+    if missing:
+        # Locks taken in sorted order so two concurrent multi-fetches
+        # can't deadlock against each other
+        for lang in missing:
+            _apps_cache_locks[lang].acquire()
+        try:
+            still_missing = []
+            for lang in missing:
+                # Re-check: another thread may have refilled while we waited
+                cached = _apps_cache.get(lang)
+                if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+                    result[lang] = cached[1]
+                else:
+                    still_missing.append(lang)
+            if still_missing:
+                fetched = get_sheets_client().get_applications_for_followup_multi(still_missing)
+                for lang, apps in fetched.items():
+                    result[lang] = _annotate_and_store(lang, apps)
+        finally:
+            for lang in missing:
+                _apps_cache_locks[lang].release()
+
+    return result
+
+
+# lowercased company name -> applications, derived from the row cache.
+# Tagged with the source entries' timestamps so it rebuilds exactly once
+# per cache refresh instead of rescanning per company-detail view.
+_company_index = None
+
+
+def get_apps_by_company():
+    """Return the cached {lower(company): [apps]} inverted index."""
+    global _company_index
+
+    apps_map = get_apps_cached_multi()
+
+    # A concurrent invalidate_apps_cache() may have popped the entries the
+    # map was served from; a None stamp component forces a rebuild from
+    # the snapshot we already hold instead of raising KeyError.
+    stamp = tuple(
+        entry[0] if (entry := _apps_cache.get(lang)) is not None else None
+        for lang in ('en', 'fr')
+    )
+
+    if _company_index is None or _company_index[0] != stamp or None in stamp:
+        index = {}
+        for apps in apps_map.values():
+            for app in apps:
+                index.setdefault(app.get('company', '').lower(), []).append(app)
+        _company_index = (stamp, index)
+
+    return _company_index[1]
+
+
+# Analytics aggregates recompute over the same sheet rows on every page
+# hit; dashboard refreshes are frequent enough that a slightly longer TTL
+# than the raw rows is worth it.
+ANALYTICS_TTL = 60  # seconds
+
+_analytics_memo = {}  # (method, *args) -> (monotonic timestamp, value)
+
+
+def analytics_cached(method_name: str, *args):
+    """Call an AnalyticsEngine method, memoized with a short TTL."""
+    key = (method_name,) + args
+    cached = _analytics_memo.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ANALYTICS_TTL:
+        return cached[1]
+
+    value = getattr(get_analytics(), method_name)(*args)
+    _analytics_memo[key] = (time.monotonic(), value)
+    return value
+
+
+# Last 10 sent applications, maintained on write so home doesn't select
+# top-N on every render. Seeded lazily from the cached rows; sends
+# appendleft, row edits/deletes clear it so the next render reseeds.
+RECENT_APPS = collections.deque(maxlen=10)
+
+
+@functools.lru_cache(maxsize=8)
+def _tz(name: str):
+    """Memoized pytz.timezone: constructing a tzinfo reads zone data from
+    disk, and the handlers ask for the same zone on every request."""
+    return pytz.timezone(name)
+
+
+def invalidate_apps_cache():
+    """Drop cached rows and analytics after a write touches the sheets."""
+    _apps_cache.pop('en', None)
+    _apps_cache.pop('fr', None)
+    _statuses_cache.clear()
+    _analytics_memo.clear()
+
+
+async def _fetch_apps(lang: str):
+    """Run the (blocking) cached fetch off the event loop.
+
+    Lets handlers gather EN and FR reads concurrently instead of paying
+    two sequential Sheets round-trips on a cache miss.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        EXECUTOR, get_apps_cached, lang
+    )
+
+
+@app.on_event("startup")
+async def warm_clients():
+    """Pay the OAuth handshake and first Sheets reads before traffic.
+
+    The lazy None guards in get_clients() stay as the fallback (tests and
+    environments without credentials), so warm-up failure is non-fatal.
+    """
+    try:
+        await asyncio.gather(
+            asyncio.get_running_loop().run_in_executor(EXECUTOR, get_clients),
+            asyncio.get_running_loop().run_in_executor(EXECUTOR, get_template_manager),
+        )
+        get_analytics()
+        await asyncio.gather(_fetch_apps('en'), _fetch_apps('fr'))
+    except Exception as e:
+        print(f"[WARN] Startup warm-up failed (will initialize lazily): {e}")
+
+    # Force-compile every page template now so the first hit of each view
+    # doesn't pay the parse
+    for tmpl in templates_path.glob("*.html"):
+        try:
+            templates.get_template(tmpl.name)
+        except Exception as e:
+            print(f"[WARN] Failed to precompile template {tmpl.name}: {e}")
+
+
 def normalize_website_url(url: Optional[str]) -> Optional[str]:
     """Normalize website URLs so bare domains become valid HTTPS addresses."""
     if url is None:
@@ -102,31 +397,65 @@ def normalize_website_url(url: Optional[str]) -> Optional[str]:
     return urlunparse(parsed)
 
 
+# Form fields the send page can prefill from the query string, in the
+# order the template context exposes them as prefill_<field>.
+PREFILL_FIELDS = (
+    'email', 'company', 'phone', 'website', 'company_type',
+    'attachment', 'attachment_en', 'attachment_fr',
+    'position', 'position_en', 'position_fr',
+    'body', 'body_en', 'body_fr',
+    'place', 'salary', 'reference', 'notes'
+)
+
+
+# Statuses that count as a positive response; frozenset so the per-app
+# membership test below is a hash lookup, not a list scan.
+POSITIVE_STATUSES = frozenset({
+    'Interview', 'Call Received', 'Hired', 'Offer',
+    'Interview Scheduled', 'Interview Complete'
+})
+
+# Shared per-request constants: handlers pass these by reference instead
+# of rebuilding the same small lists on every hit
+STATUS_OPTIONS = (
+    'Pending', 'Sent', 'Follow-up Sent', 'Call Received',
+    'Interview Scheduled', 'Interview Complete', 'Offer',
+    'Hired', 'Rejected', 'Bounced', 'Failed', 'Frozen'
+)
+
+LANG_PAIR = ('en', 'fr')
+
+# Recipient lists arrive comma-, semicolon- or newline-separated; one
+# compiled split handles all of it and strips surrounding whitespace
+_EMAIL_SPLIT_RE = re.compile(r'[,;\s]+')
+
+
 def calculate_real_response_rate(all_apps):
     """Calculate real response rate based on actual responses."""
     if not all_apps:
         return 0
 
-    # Count applications with positive responses
-    positive_statuses = [
-        'Interview', 'Call Received', 'Hired', 'Offer',
-        'Interview Scheduled', 'Interview Complete'
-    ]
     responded = sum(1 for app in all_apps
-                   if app.get('status') in positive_statuses)
-    return (responded / len(all_apps) * 100) if len(all_apps) > 0 else 0
+                    if app.get('status') in POSITIVE_STATUSES)
+    return responded / len(all_apps) * 100
 
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
-    sheets_client, _, _ = get_clients()
-    analytics = get_analytics()
+    sheets_client = get_sheets_client()
 
     try:
         tz_name = settings_manager.get_setting('timezone', 'UTC')
-        # Get all applications
-        apps_en = sheets_client.get_applications_for_followup('en')
-        apps_fr = sheets_client.get_applications_for_followup('fr')
+
+        # Applications (one batchGet for both languages) and the analytics
+        # aggregates hit Sheets independently, so fetch them concurrently.
+        loop = asyncio.get_running_loop()
+        apps_map, timeline, company_heatmap = await asyncio.gather(
+            loop.run_in_executor(EXECUTOR, get_apps_cached_multi),
+            loop.run_in_executor(EXECUTOR, analytics_cached, 'get_timeline_data', 30),
+            loop.run_in_executor(EXECUTOR, analytics_cached, 'get_company_heatmap', 5),
+        )
+        apps_en, apps_fr = apps_map['en'], apps_map['fr']
         all_apps = apps_en + apps_fr
 
         def annotate_apps(apps):
@@ -134,48 +463,43 @@ async def home(request: Request):
                 app['display_sent'] = format_timestamp(app.get('sent_date'), tz_name)
             return apps
 
-        # Calculate real stats
+        # Calculate real stats in a single pass (dates pre-parsed by the
+        # cache layer, so no per-row isoformat work here)
         total_applications = len(all_apps)
 
-        # Sent today (use timezone from settings)
-        tz = pytz.timezone(tz_name)
-        today = datetime.now(tz).date()
-        sent_today = sum(1 for app in all_apps
-                         if app.get('sent_date') and
-                         datetime.fromisoformat(app['sent_date']).date() == today)
+        tz = _tz(tz_name)
+        now = datetime.now(tz)
+        today = now.date()
 
-        # Due follow-ups
-        due_followups = sum(1 for app in all_apps
-                            if is_followup_due(app.get('next_followup_date', '')))
+        sent_today = 0
+        due_followups = 0
+        today_apps = []
+
+        for app in all_apps:
+            if app.get('_sent_date_obj') == today:
+                sent_today += 1
+                today_apps.append(app)
+            if is_followup_due(app.get('next_followup_date', ''), now):
+                due_followups += 1
+
+        annotate_apps(today_apps)
 
         # REAL Response rate calculation
         response_rate = calculate_real_response_rate(all_apps)
 
-        # Get timeline data (real)
-        timeline = analytics.get_timeline_data(30)
-
         # Language distribution (real)
         lang_dist = {
             'en': len(apps_en),
             'fr': len(apps_fr)
         }
 
-        # Top companies (real)
-        company_heatmap = analytics.get_company_heatmap(5)
-
-        # Today's activity (real)
-        today_apps = annotate_apps([
-            app for app in all_apps
-            if app.get('sent_date') and
-            datetime.fromisoformat(app['sent_date']).date() == today
-        ])
-
-        # Recent applications
-        recent_applications = annotate_apps(sorted(
-            all_apps,
-            key=lambda x: x.get('sent_date', ''),
-            reverse=True
-        )[:10])
+        # Recent applications: served from the write-maintained deque;
+        # reseed with a bounded heap pass only when it's empty
+        if not RECENT_APPS:
+            RECENT_APPS.extend(heapq.nlargest(
+                10, all_apps, key=lambda x: x.get('sent_date') or ''
+            ))
+        recent_applications = annotate_apps(list(RECENT_APPS))
 
     except Exception as e:
         print(f"Error loading dashboard data: {e}")
@@ -207,7 +531,7 @@ async def home(request: Request):
 
 
 @app.get("/send", response_class=HTMLResponse)
-async def send_page(
+def send_page(
     request: Request,
     template: Optional[str] = None,
     company: Optional[str] = None,
@@ -274,31 +598,29 @@ async def send_page(
     default_position_fr = template_position_fr or get_default_position('fr')
 
     # --- Prefill from query params (company detail link passes these) ---
-    # Use request.query_params for optional extras (attachment, position, bodies, etc.)
+    # One declarative pass instead of a dozen hand-written .get chains:
+    # explicit handler params win, then the query string, then the
+    # template-derived fallbacks merged below.
     query = request.query_params
 
-    prefill_email = email or query.get('emails') or ''
-    prefill_company = company or query.get('company') or ''
-    prefill_phone = phone or query.get('phone') or ''
-    prefill_website = website or query.get('website') or ''
-    prefill_company_type = company_type or query.get('company_type') or ''
-
-    prefill_attachment = query.get('attachment')  # single attachment name
-    prefill_attachment_en = query.get('attachment_en')
-    prefill_attachment_fr = query.get('attachment_fr')
-
-    prefill_position = query.get('position') or ''
-    prefill_position_en = query.get('position_en') or template_position_en or ''
-    prefill_position_fr = query.get('position_fr') or template_position_fr or ''
+    explicit = {
+        'email': email or query.get('emails'),
+        'company': company,
+        'phone': phone,
+        'website': website,
+        'company_type': company_type,
+        'reference': reference,
+    }
 
-    prefill_body = query.get('body') or ''
-    prefill_body_en = query.get('body_en') or template_body_en or ''
-    prefill_body_fr = query.get('body_fr') or template_body_fr or ''
+    prefill = {
+        field: explicit.get(field) or query.get(field) or ''
+        for field in PREFILL_FIELDS
+    }
 
-    prefill_place = query.get('place') or ''
-    prefill_salary = query.get('salary') or ''
-    prefill_reference = reference or query.get('reference') or ''
-    prefill_notes = query.get('notes') or ''
+    prefill['position_en'] = prefill['position_en'] or template_position_en or ''
+    prefill['position_fr'] = prefill['position_fr'] or template_position_fr or ''
+    prefill['body_en'] = prefill['body_en'] or template_body_en or ''
+    prefill['body_fr'] = prefill['body_fr'] or template_body_fr or ''
 
     return templates.TemplateResponse(
         "send.html",
@@ -312,30 +634,15 @@ async def send_page(
             "default_position_fr": default_position_fr,
             "default_language": template_language if template else default_language,
             # Prefill values for the form
-            "prefill_email": prefill_email,
-            "prefill_company": prefill_company,
-            "prefill_phone": prefill_phone,
-            "prefill_website": prefill_website,
-            "prefill_company_type": prefill_company_type,
-            "prefill_attachment": prefill_attachment,
-            "prefill_attachment_en": prefill_attachment_en,
-            "prefill_attachment_fr": prefill_attachment_fr,
-            "prefill_position": prefill_position,
-            "prefill_position_en": prefill_position_en,
-            "prefill_position_fr": prefill_position_fr,
-            "prefill_body": prefill_body,
-            "prefill_body_en": prefill_body_en,
-            "prefill_body_fr": prefill_body_fr,
-            "prefill_place": prefill_place,
-            "prefill_salary": prefill_salary,
-            "prefill_reference": prefill_reference,
-            "prefill_notes": prefill_notes,
+            **{f"prefill_{field}": value for field, value in prefill.items()},
             "companies": companies
         }
     )
 
 @app.post("/send")
+@limiter.limit("30/minute")
 async def send_application(
+        request: Request,
         emails: str = Form(...),
         language: str = Form(...),
         company: Optional[str] = Form(None),
@@ -367,8 +674,9 @@ async def send_application(
         value = value.strip()
         return value if value else None
 
-    # Parse emails (support newline-separated lists)
-    email_list = [e.strip() for e in emails.replace('\n', ',').split(',') if e.strip()]
+    # Parse emails (comma, semicolon or newline separated) in one pass,
+    # without materializing the newline-to-comma intermediate string
+    email_list = [e for e in _EMAIL_SPLIT_RE.split(emails) if e]
 
     # Validate emails
     invalid_emails = [e for e in email_list if not validate_email(e)]
@@ -382,7 +690,7 @@ async def send_application(
     email_delay = settings_manager.get_setting('email_delay', 2)
 
     # Process languages
-    languages = ['en', 'fr'] if language == 'both' else [language]
+    languages = LANG_PAIR if language == 'both' else (language,)
 
     company_name = clean_optional(company)
     company_type_value = clean_optional(company_type)
@@ -393,10 +701,15 @@ async def send_application(
     place_value = clean_optional(place)
     reference_value = clean_optional(reference)
 
-    # Ensure company data is captured/updated in Companies sheet when provided
+    loop = asyncio.get_running_loop()
+
+    # Ensure company data is captured/updated in Companies sheet when
+    # provided. The upsert is several Sheets round-trips, so it runs on
+    # the executor like every other Sheets call in this handler.
     try:
         if company_name:
-            sheets_client.upsert_company_from_application(
+            await loop.run_in_executor(EXECUTOR, functools.partial(
+                sheets_client.upsert_company_from_application,
                 company_name=company_name,
                 emails=email_list,
                 company_type=company_type_value,
@@ -406,64 +719,29 @@ async def send_application(
                 reference=reference_value,
                 salary_range=salary_value,
                 notes=notes_value
-            )
+            ))
     except Exception as e:
         print(f"[WARN] Failed to upsert company from send form: {e}")
 
     results = []
 
-    for lang in languages:
-        # Get position
-        if language == 'both':
-            final_position = position_en if lang == 'en' else position_fr
-        else:
-            final_position = position
-
-        if not final_position:
-            final_position = get_default_position(lang)
-
-        final_company = company_name or get_default_company(lang)
-
-        # Get body
-        if language == 'both':
-            final_body_template = body_en if lang == 'en' else body_fr
-        else:
-            final_body_template = body
-
-        if not final_body_template:
-            final_body_template = get_default_body(lang)
+    # Small fan-out per send: Gmail's quota tolerates a little concurrency,
+    # and it removes the serial email_delay floor (N recipients used to
+    # block the worker for N * delay seconds).
+    send_sem = asyncio.Semaphore(settings_manager.get_setting('gmail_concurrency', 3))
 
-        # Get attachment
-        if language == 'both':
-            attachment_filename = attachment_en if lang == 'en' else attachment_fr
-        else:
-            attachment_filename = attachment
-
-        if not attachment_filename:
-            results.append({
-                'language': lang,
-                'status': 'error',
-                'message': f'No attachment selected for {lang}'
-            })
-            continue
-
-        attachment_path = attachment_selector.get_attachment_path(lang, attachment_filename)
-        if not attachment_path:
-            results.append({
-                'language': lang,
-                'status': 'error',
-                'message': f'Attachment not found in {lang} folder'
-            })
-            continue
-
-        # Send to each recipient
-        for recipient_email in email_list:
+    async def _send_one(recipient_email, lang, final_company, final_position,
+                        final_body_template, attachment_path, attachment_filename):
+        async with send_sem:
             try:
-                existing_app = sheets_client.find_application_by_email(recipient_email, lang)
+                existing_app = await loop.run_in_executor(
+                    None, sheets_client.find_application_by_email, recipient_email, lang
+                )
 
                 if existing_app:
                     app_id = existing_app["id"]
-                    updated = sheets_client.update_application_fields(
+                    updated = await loop.run_in_executor(EXECUTOR, functools.partial(
+                        sheets_client.update_application_fields,
                         app_id=app_id,
                         language=lang,
                         company=final_company,
@@ -476,11 +754,12 @@ async def send_application(
                         place=place_value,
                         reference=reference_value,
                         status='Pending'
-                    )
+                    ))
                     if not updated:
                         raise ValueError("Failed to update existing application row")
                 else:
-                    app_id = sheets_client.add_application(
+                    app_id = await loop.run_in_executor(EXECUTOR, functools.partial(
+                        sheets_client.add_application,
                         email=recipient_email,
                         language=lang,
                         company=final_company,
@@ -493,7 +772,7 @@ async def send_application(
                         salary=salary_value,
                         place=place_value,
                         reference=reference_value
-                    )
+                    ))
 
                 final_body = substitute_placeholders(
                     final_body_template,
@@ -502,65 +781,161 @@ async def send_application(
                     lang
                 )
 
-                # Use delay from settings (basic randomized delay to avoid bursts)
-                time.sleep(email_delay + random.uniform(0, 1))
+                # Use delay from settings (basic randomized delay to avoid
+                # bursts); asyncio.sleep keeps the event loop free meanwhile
+                await asyncio.sleep(email_delay + random.uniform(0, 1))
 
                 # Send email via mailer (assumes GmailMailer has send_email)
-                result = mailer.send_email(
+                await loop.run_in_executor(EXECUTOR, functools.partial(
+                    mailer.send_email,
                     to_email=recipient_email,
                     subject=final_position,
                     body=final_body,
                     attachment_path=attachment_path
-                )
-
-                sheets_client.update_application_sent(
+                ))
+
+                # Buffer the bookkeeping writes; the single flush() after
+                # the language loop ships them in one batchUpdate + append
+                # instead of two round-trips per recipient. (Row index
+                # resolution may hit Sheets on a cache miss, hence the
+                # executor.)
+                await loop.run_in_executor(
+                    None, sheets_client.queue_update_application_sent,
                     app_id, lang, final_body, attachment_filename
                 )
 
-                sheets_client.log_activity(
+                sheets_client.queue_log_activity(
                     app_id, recipient_email, 'email_sent', 'success',
                     'Sent via web UI'
                 )
 
-                results.append({
+                RECENT_APPS.appendleft({
+                    'id': app_id,
+                    'company': final_company,
+                    'email': recipient_email,
+                    'position': final_position,
+                    'language': lang,
+                    'status': 'Sent',
+                    'sent_date': get_current_timestamp(),
+                })
+
+                return {
                     'language': lang,
                     'email': recipient_email,
                     'status': 'success',
                     'app_id': app_id
-                })
+                }
 
             except Exception as e:
-                results.append({
+                return {
                     'language': lang,
                     'email': recipient_email,
                     'status': 'error',
                     'message': str(e)
-                })
+                }
+
+    for lang in languages:
+        # Get position
+        if language == 'both':
+            final_position = position_en if lang == 'en' else position_fr
+        else:
+            final_position = position
+
+        if not final_position:
+            final_position = get_default_position(lang)
+
+        final_company = company_name or get_default_company(lang)
+
+        # Get body
+        if language == 'both':
+            final_body_template = body_en if lang == 'en' else body_fr
+        else:
+            final_body_template = body
+
+        if not final_body_template:
+            final_body_template = get_default_body(lang)
+
+        # Get attachment
+        if language == 'both':
+            attachment_filename = attachment_en if lang == 'en' else attachment_fr
+        else:
+            attachment_filename = attachment
+
+        if not attachment_filename:
+            results.append({
+                'language': lang,
+                'status': 'error',
+                'message': f'No attachment selected for {lang}'
+            })
+            continue
+
+        attachment_path = attachment_selector.get_attachment_path(lang, attachment_filename)
+        if not attachment_path:
+            results.append({
+                'language': lang,
+                'status': 'error',
+                'message': f'Attachment not found in {lang} folder'
+            })
+            continue
+
+        # Send to each recipient concurrently (bounded by send_sem)
+        results.extend(await asyncio.gather(*[
+            _send_one(
+                recipient_email, lang, final_company, final_position,
+                final_body_template, attachment_path, attachment_filename
+            )
+            for recipient_email in email_list
+        ]))
+
+    # One batched write for everything queued during the campaign. The
+    # emails are already out, so a flush failure must not fail the
+    # request — flush() re-queues the batch and a later flush retries it.
+    try:
+        await loop.run_in_executor(EXECUTOR, sheets_client.flush)
+    except Exception as e:
+        print(f"[WARN] Failed to flush queued updates (kept for retry): {e}")
+
+    # Rows changed; next dashboard read should see them immediately
+    invalidate_apps_cache()
 
     return JSONResponse(content={'results': results})
 
 
 @app.get("/applications", response_class=HTMLResponse)
-async def applications_page(
+def applications_page(
         request: Request,
         lang: str = "en",
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        page: int = 1,
+        limit: int = 50
 ):
-    sheets_client, _, _ = get_clients()
+    page = max(page, 1)
+    limit = max(min(limit, 200), 1)
 
     try:
-        applications = sheets_client.get_applications_for_followup(lang)
+        all_apps = get_apps_cached(lang)
+        statuses = get_statuses_cached(lang)
 
         if status:
-            applications = [app for app in applications if app.get('status') == status]
+            applications = [app for app in all_apps if app.get('status') == status]
+        else:
+            applications = all_apps
 
-        all_apps = sheets_client.get_applications_for_followup(lang)
-        statuses = sorted(set(app.get('status', 'Unknown') for app in all_apps))
+        # Render one page worth of rows; Jinja CPU no longer grows with
+        # the sheet. The fetch itself is shared through the TTL cache, so
+        # slicing happens on the in-memory list rather than a ranged
+        # Sheets read (follow-up filtering breaks row-offset arithmetic).
+        total_count = len(applications)
+        start = (page - 1) * limit
+        applications = applications[start:start + limit]
 
     except Exception as e:
         print(f"Applications page error: {e}")
         applications = []
         statuses = []
+        total_count = 0
+
+    total_pages = max((total_count + limit - 1) // limit, 1)
 
     return templates.TemplateResponse(
         "applications.html",
@@ -569,32 +944,42 @@ async def applications_page(
             "applications": applications,
             "current_lang": lang,
             "current_status": status,
-            "statuses": statuses
+            "statuses": statuses,
+            "page": page,
+            "limit": limit,
+            "total_count": total_count,
+            "total_pages": total_pages
         }
     )
 
 
 @app.get("/followups", response_class=HTMLResponse)
 async def followups_page(request: Request, lang: str = "both"):
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
-    languages = ['en', 'fr'] if lang == 'both' else [lang]
+    languages = LANG_PAIR if lang == 'both' else (lang,)
 
     due_applications = []
 
-    for language in languages:
-        try:
-            apps = sheets_client.get_applications_for_followup(language)
+    fetched = await asyncio.gather(
+        *[_fetch_apps(language) for language in languages],
+        return_exceptions=True
+    )
 
-            for app in apps:
-                if is_followup_due(app.get('next_followup_date', '')):
-                    app['language'] = language
-                    due_applications.append(app)
-        except Exception as e:
-            print(f"Followups retrieval error for {language}: {e}")
-            pass
+    now = datetime.now(_tz(settings_manager.get_setting('timezone', 'UTC')))
+
+    for language, apps in zip(languages, fetched):
+        if isinstance(apps, Exception):
+            print(f"Followups retrieval error for {language}: {apps}")
+            continue
 
-    due_applications.sort(key=lambda x: x.get('next_followup_date', ''))
+        for app in filter_due(apps, now):
+            app['language'] = language
+            due_applications.append(app)
+
+    # Every due row has a parseable next_followup_date (filter_due skips
+    # the rest), so the C-level itemgetter is safe as the sort key
+    due_applications.sort(key=operator.itemgetter('next_followup_date'))
 
     return templates.TemplateResponse(
         "followups.html",
@@ -607,7 +992,9 @@ async def followups_page(request: Request, lang: str = "both"):
 
 
 @app.post("/followups/process")
+@limiter.limit("10/minute")
 async def process_followups(
+        request: Request,
         language: str = Form(...),
         dry_run: bool = Form(False)
 ):
@@ -619,24 +1006,36 @@ async def process_followups(
     engine = FollowupEngine(sheets_client, mailer, attachment_selector)
 
     try:
-        stats = engine.process_followups(language=language, dry_run=dry_run)
+        # Long-running (sends emails, multiple Sheets writes); keep it off
+        # the event loop so other requests stay responsive meanwhile
+        stats = await asyncio.get_running_loop().run_in_executor(
+            EXECUTOR,
+            functools.partial(engine.process_followups, language=language, dry_run=dry_run)
+        )
+
+        if not dry_run:
+            # The run rewrote statuses, counts and next dates; drop the
+            # cached rows so the dashboard and /followups stop listing
+            # the just-processed applications as due
+            invalidate_apps_cache()
+            RECENT_APPS.clear()
+
         return JSONResponse(content={'success': True, 'stats': stats})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/analytics", response_class=HTMLResponse)
-async def analytics_page(request: Request):
+def analytics_page(request: Request):
     """Analytics dashboard with comprehensive metrics."""
-    analytics = get_analytics()
-
     try:
-        # Get all analytics data
-        stats = analytics.get_dashboard_stats()
-        timeline = analytics.get_timeline_data(30)
-        company_heatmap = analytics.get_company_heatmap(10)
-        status_dist = analytics.get_status_distribution()
-        followup_data = analytics.get_followup_effectiveness()
+        # Get all analytics data (memoized, so back-to-back refreshes
+        # serve from memory)
+        stats = analytics_cached('get_dashboard_stats')
+        timeline = analytics_cached('get_timeline_data', 30)
+        company_heatmap = analytics_cached('get_company_heatmap', 10)
+        status_dist = analytics_cached('get_status_distribution')
+        followup_data = analytics_cached('get_followup_effectiveness')
 
         # Log analytics view
         from src.monitoring import system_monitor
@@ -701,7 +1100,7 @@ async def analytics_page(request: Request):
 
 
 @app.get("/templates", response_class=HTMLResponse)
-async def templates_page(request: Request):
+def templates_page(request: Request):
     try:
         template_manager = get_template_manager()
         templates_data = template_manager.get_all_templates()
@@ -719,7 +1118,9 @@ async def templates_page(request: Request):
 
 
 @app.post("/api/templates/{category}/{template_id}")
-async def save_template(
+@limiter.limit("60/minute")
+def save_template(
+        request: Request,
         category: str,
         template_id: str,
         name: str = Form(...),
@@ -746,7 +1147,8 @@ async def save_template(
 
 
 @app.delete("/api/templates/{category}/{template_id}")
-async def delete_template(category: str, template_id: str):
+@limiter.limit("60/minute")
+def delete_template(request: Request, category: str, template_id: str):
     template_manager = get_template_manager()
     template_manager.delete_template(category, template_id)
 
@@ -754,7 +1156,9 @@ async def delete_template(category: str, template_id: str):
 
 
 @app.post("/api/templates")
-async def create_template(
+@limiter.limit("60/minute")
+def create_template(
+    request: Request,
     name: str = Form(...),
     language: str = Form(...),
     category: str = Form(...),
@@ -784,56 +1188,106 @@ async def create_template(
         )
 
 
+# Canonical CSV columns: the keys _parse_followup_rows emits, pinned here
+# so the export schema doesn't drift with whatever per-page annotations
+# (display_sent, ...) happen to sit on the shared cached rows.
+EXPORT_FIELDNAMES = [
+    'id', 'company', 'email', 'position', 'language', 'status',
+    'sent_date', 'followups', 'next_followup_date', 'phone', 'website',
+    'body', 'cv', 'notes', 'type', 'salary', 'place', 'reference',
+]
+
+
 @app.post("/api/settings/export")
 async def export_data():
-    sheets_client, _, _ = get_clients()
-
     try:
-        apps_en = sheets_client.get_applications_for_followup('en')
-        apps_fr = sheets_client.get_applications_for_followup('fr')
-        all_apps = apps_en + apps_fr
-
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=all_apps[0].keys() if all_apps else [])
-        writer.writeheader()
-        writer.writerows(all_apps)
-
-        csv_content = output.getvalue()
-
-        return JSONResponse(content={
-            'success': True,
-            'data': csv_content,
-            'filename': f'applications_export_{datetime.now().strftime("%Y%m%d")}.csv'
-        })
+        apps_map = await asyncio.get_running_loop().run_in_executor(
+            EXECUTOR, get_apps_cached_multi
+        )
+        apps_en, apps_fr = apps_map['en'], apps_map['fr']
     except Exception as e:
         return JSONResponse(content={'success': False, 'error': str(e)})
 
+    fieldnames = EXPORT_FIELDNAMES
+
+    # Stream CSV rows as they are serialized instead of buffering the
+    # whole sheet in a string and JSON-escaping it into the response.
+    def generate():
+        buf = io.StringIO()
+        # Page views may annotate cached rows with extra keys; ignore them
+        writer = csv.DictWriter(buf, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+        for apps in (apps_en, apps_fr):
+            for row in apps:
+                writer.writerow(row)
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+
+    filename = f'applications_export_{datetime.now().strftime("%Y%m%d")}.csv'
+
+    return StreamingResponse(
+        generate(),
+        media_type='text/csv',
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
 
 @app.post("/api/settings/clear")
-async def clear_data():
+def clear_data():
     # This is a dangerous operation - require confirmation
     return JSONResponse(content={'success': False, 'error': 'Not implemented for safety'})
 
 
-@app.get("/api/attachments/{language}")
-async def get_attachments(language: str):
-    _, _, attachment_selector = get_clients()
+@functools.lru_cache(maxsize=8)
+def _attachment_listing(language: str, folder_mtime_ns: int):
+    """File metadata for one folder state.
 
-    attachments = [
-        {
+    Keyed on the folder's mtime so the cache self-invalidates whenever a
+    file is added, removed or renamed; steady-state requests then skip
+    the glob and the per-file stat syscalls entirely.
+    """
+    attachments = []
+    for f in get_attachment_selector().get_attachments(language):
+        st = f.stat()  # one syscall per file; size and mtime come together
+        attachments.append({
             'name': f.name,
-            'size': f.stat().st_size,
-            'modified': f.stat().st_mtime
-        }
-        for f in attachment_selector.get_attachments(language)
-    ]
+            'size': st.st_size,
+            'modified': st.st_mtime
+        })
+    return attachments
+
+
+@app.get("/api/attachments/{language}")
+def get_attachments(language: str):
+    folder = get_attachment_selector().folders.get(language)
+
+    try:
+        folder_mtime_ns = os.stat(folder).st_mtime_ns if folder else None
+    except OSError:
+        folder_mtime_ns = None
 
-    return JSONResponse(content={'attachments': attachments})
+    if folder_mtime_ns is None:
+        return JSONResponse(content={'attachments': []})
+
+    return JSONResponse(
+        content={'attachments': _attachment_listing(language, folder_mtime_ns)}
+    )
+
+
+# Gmail rejects attachments over 25 MB, so anything larger can never be
+# sent anyway; refuse it at upload time instead of storing it.
+MAX_ATTACHMENT_BYTES = 25 * 1024 * 1024
 
 
 @app.post("/api/upload-attachment")
+@limiter.limit("30/minute")
 async def upload_attachment(
+        request: Request,
         language: str = Form(...),
         file: UploadFile = File(...)
 ):
@@ -842,9 +1296,26 @@ async def upload_attachment(
 
     file_path = folder / file.filename
 
-    with open(file_path, 'wb') as f:
-        content = await file.read()
-        f.write(content)
+    # Copy in 1 MiB chunks so a large CV never sits fully in memory, and
+    # through aiofiles so the disk writes don't block the event loop
+    received = 0
+    async with aiofiles.open(file_path, 'wb') as out:
+        while chunk := await file.read(1 << 20):
+            received += len(chunk)
+            if received > MAX_ATTACHMENT_BYTES:
+                break
+            await out.write(chunk)
+
+    if received > MAX_ATTACHMENT_BYTES:
+        file_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=413,
+            detail=f"Attachment exceeds {MAX_ATTACHMENT_BYTES // (1024 * 1024)} MB limit"
+        )
+
+    # Overwriting an existing file changes its mtime but not the
+    # folder's, so the listing cache can't see it — drop it explicitly
+    _attachment_listing.cache_clear()
 
     return JSONResponse(content={
         'success': True,
@@ -854,9 +1325,9 @@ async def upload_attachment(
 
 
 @app.post("/api/companies/initialize")
-async def initialize_companies_sheet():
+def initialize_companies_sheet():
     """Initialize the Companies sheet with proper headers."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
         # Initialize just the Companies sheet
@@ -874,9 +1345,9 @@ async def initialize_companies_sheet():
 
 
 @app.get("/companies", response_class=HTMLResponse)
-async def companies_page(request: Request):
+def companies_page(request: Request):
     """Companies management page."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
         # Auto-initialize sheets (safe, idempotent)
@@ -890,14 +1361,16 @@ async def companies_page(request: Request):
 
         # Calculate recent count (this month)
         timezone = settings_manager.get_setting('timezone', 'UTC')
-        tz = pytz.timezone(timezone)
+        tz = _tz(timezone)
         now = datetime.now(tz)
         first_day_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
+        # Zero-padded ISO-8601 sorts lexicographically, so a plain string
+        # compare replaces a fromisoformat parse per company
+        cutoff_str = first_day_of_month.isoformat()
         recent_count = sum(
             1 for company in companies
-            if company.get('added_date') and
-            datetime.fromisoformat(company['added_date']) >= first_day_of_month
+            if (d := company.get('added_date')) and d >= cutoff_str
         )
 
     except Exception as e:
@@ -917,7 +1390,7 @@ async def companies_page(request: Request):
 
 
 @app.post("/api/companies")
-async def create_company(
+def create_company(
         name: str = Form(...),
         type: Optional[str] = Form(None),
         email: Optional[str] = Form(None),
@@ -929,7 +1402,7 @@ async def create_company(
         notes: Optional[str] = Form(None)
 ):
     """Create a new company and return the created company object."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
         company_id = sheets_client.add_company(
@@ -961,9 +1434,9 @@ async def create_company(
 
 
 @app.get("/api/companies/{company_id}")
-async def get_company(company_id: str):
+def get_company(company_id: str):
     """Get a specific company by ID."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
         company = sheets_client.get_company_by_id(company_id)
@@ -986,7 +1459,7 @@ async def get_company(company_id: str):
 
 
 @app.put("/api/companies/{company_id}")
-async def update_company(
+def update_company(
         company_id: str,
         name: str = Form(...),
         type: Optional[str] = Form(None),
@@ -999,7 +1472,7 @@ async def update_company(
         notes: Optional[str] = Form(None)
 ):
     """Update an existing company."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
         success = sheets_client.update_company(
@@ -1033,9 +1506,9 @@ async def update_company(
 
 
 @app.delete("/api/companies/{company_id}")
-async def delete_company(company_id: str):
+def delete_company(company_id: str):
     """Delete a company."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
         success = sheets_client.delete_company(company_id)
@@ -1058,9 +1531,9 @@ async def delete_company(company_id: str):
 
 
 @app.get("/companies/{company_id}", response_class=HTMLResponse)
-async def company_detail_page(request: Request, company_id: str):
+def company_detail_page(request: Request, company_id: str):
     """View detailed information about a specific company."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
         company = sheets_client.get_company_by_id(company_id)
@@ -1068,16 +1541,9 @@ async def company_detail_page(request: Request, company_id: str):
         if not company:
             raise HTTPException(status_code=404, detail="Company not found")
 
-        # Get applications for this company (both EN and FR)
-        apps_en = sheets_client.get_applications_for_followup('en')
-        apps_fr = sheets_client.get_applications_for_followup('fr')
-        all_apps = apps_en + apps_fr
-
-        # Filter applications for this company
-        company_apps = [
-            app for app in all_apps
-            if app.get('company', '').lower() == company['name'].lower()
-        ]
+        # Applications for this company via the cached inverted index:
+        # O(1) per view instead of a lowercasing scan over every app
+        company_apps = get_apps_by_company().get(company['name'].lower(), [])
 
     except HTTPException:
         raise
@@ -1095,7 +1561,7 @@ async def company_detail_page(request: Request, company_id: str):
 
 
 @app.get("/monitoring", response_class=HTMLResponse)
-async def monitoring_page(request: Request):
+def monitoring_page(request: Request):
     sheets_client, mailer, _ = get_clients()
 
     try:
@@ -1111,17 +1577,17 @@ async def monitoring_page(request: Request):
         gmail_stats = system_monitor.get_api_stats('gmail', 60)
         sheets_stats = system_monitor.get_api_stats('sheets', 60)
 
-        # Calculate quota usage (real data)
-        apps_en = sheets_client.get_applications_for_followup('en')
-        apps_fr = sheets_client.get_applications_for_followup('fr')
-        all_apps = apps_en + apps_fr
+        # Calculate quota usage (real data; one batched, cached fetch)
+        apps_map = get_apps_cached_multi()
+        all_apps = apps_map['en'] + apps_map['fr']
 
         timezone = settings_manager.get_setting('timezone', 'UTC')
-        tz = pytz.timezone(timezone)
+        tz = _tz(timezone)
         today = datetime.now(tz).date()
+        # Dates were parsed once when the rows entered the cache; no
+        # per-row fromisoformat here
         sent_today_count = sum(1 for app in all_apps
-                               if app.get('sent_date') and
-                               datetime.fromisoformat(app['sent_date']).date() == today)
+                               if app.get('_sent_date_obj') == today)
 
         gmail_quota_used = sent_today_count
         gmail_quota_total = 250  # Gmail free tier daily limit
@@ -1176,7 +1642,7 @@ async def monitoring_page(request: Request):
 
 
 @app.get("/settings", response_class=HTMLResponse)
-async def settings_page(request: Request):
+def settings_page(request: Request):
     """Settings management page."""
     current_settings = settings_manager.get_all_settings()
     return templates.TemplateResponse(
@@ -1189,7 +1655,7 @@ async def settings_page(request: Request):
 
 
 @app.post("/api/settings/save")
-async def save_settings(
+def save_settings(
     default_language: str = Form(...),
     followup_days: int = Form(...),
     timezone: str = Form(...),
@@ -1217,8 +1683,8 @@ async def save_settings(
 
 
 @app.get("/status/{app_id}", response_class=HTMLResponse)
-async def status_page(request: Request, app_id: str, lang: str = "en"):
-    sheets_client, _, _ = get_clients()
+def status_page(request: Request, app_id: str, lang: str = "en"):
+    sheets_client = get_sheets_client()
 
     try:
         application = sheets_client.get_application_by_id(app_id, lang)
@@ -1229,33 +1695,28 @@ async def status_page(request: Request, app_id: str, lang: str = "en"):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    # Available status options
-    status_options = [
-        'Pending', 'Sent', 'Follow-up Sent', 'Call Received',
-        'Interview Scheduled', 'Interview Complete', 'Offer',
-        'Hired', 'Rejected', 'Bounced', 'Failed', 'Frozen'
-    ]
-
     return templates.TemplateResponse(
         "status.html",
         {
             "request": request,
             "application": application,
             "language": lang,
-            "status_options": status_options
+            "status_options": STATUS_OPTIONS
         }
     )
 
 
 @app.put("/api/applications/{app_id}")
-async def update_application(
+@limiter.limit("60/minute")
+def update_application(
+    request: Request,
     app_id: str,
     field: str = Form(...),
     value: str = Form(...),
     language: str = Form(...)
 ):
     """Update application field."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
         # Get current application
@@ -1263,47 +1724,21 @@ async def update_application(
         if not app:
             raise HTTPException(status_code=404, detail="Application not found")
 
-        # Update based on field
+        # Update based on field. Non-status fields go through one
+        # batchUpdate, so callers editing several cells of a row pay a
+        # single write instead of one per field.
         if field == 'status':
             sheets_client.update_application_status(app_id, language, value)
-        elif field == 'company':
-            # Update company name
-            sheet_name = sheets_client._get_sheet_name(language)
-            row_index = sheets_client._find_row_by_id(sheet_name, app_id)
-            if row_index:
-                sheets_client.service.spreadsheets().values().update(
-                    spreadsheetId=sheets_client.spreadsheet_id,
-                    range=f"{sheet_name}!B{row_index}",
-                    valueInputOption="RAW",
-                    body={"values": [[value]]}
-                ).execute()
-        elif field == 'email':
-            # Update email
-            sheet_name = sheets_client._get_sheet_name(language)
-            row_index = sheets_client._find_row_by_id(sheet_name, app_id)
-            if row_index:
-                sheets_client.service.spreadsheets().values().update(
-                    spreadsheetId=sheets_client.spreadsheet_id,
-                    range=f"{sheet_name}!C{row_index}",
-                    valueInputOption="RAW",
-                    body={"values": [[value]]}
-                ).execute()
-        elif field == 'body':
-            # Update body
-            sheet_name = sheets_client._get_sheet_name(language)
-            row_index = sheets_client._find_row_by_id(sheet_name, app_id)
-            if row_index:
-                sheets_client.service.spreadsheets().values().update(
-                    spreadsheetId=sheets_client.spreadsheet_id,
-                    range=f"{sheet_name}!K{row_index}",
-                    valueInputOption="RAW",
-                    body={"values": [[value]]}
-                ).execute()
+        elif field in SheetsClient.EDITABLE_COLUMNS:
+            sheets_client.update_application_cells(app_id, language, {field: value})
 
         sheets_client.log_activity(
             app_id, app.get('email', ''), f'field_updated_{field}', 'success', f'Updated {field} to: {value}'
         )
 
+        invalidate_apps_cache()
+        RECENT_APPS.clear()  # edited row may be in the deque; reseed
+
         return JSONResponse(content={'success': True})
 
     except Exception as e:
@@ -1314,36 +1749,48 @@ async def update_application(
 
 
 @app.delete("/api/applications/{app_id}")
-async def delete_application(app_id: str, language: str = Form(...)):
+@limiter.limit("60/minute")
+def delete_application(request: Request, app_id: str, language: str = Form(...)):
     """Delete an application."""
-    sheets_client, _, _ = get_clients()
+    sheets_client = get_sheets_client()
 
     try:
-        sheet_name = sheets_client._get_sheet_name(language)
-        row_index = sheets_client._find_row_by_id(sheet_name, app_id)
-
-        if not row_index:
+        if not sheets_client.delete_applications([app_id], language):
             raise HTTPException(status_code=404, detail="Application not found")
 
-        # Delete the row
-        sheets_client.service.spreadsheets().batchUpdate(
-            spreadsheetId=sheets_client.spreadsheet_id,
-            body={
-                "requests": [{
-                    "deleteDimension": {
-                        "range": {
-                            "sheetId": 0,  # Adjust based on your sheet structure
-                            "dimension": "ROWS",
-                            "startIndex": row_index - 1,
-                            "endIndex": row_index
-                        }
-                    }
-                }]
-            }
-        ).execute()
+        invalidate_apps_cache()
+        RECENT_APPS.clear()
 
         return JSONResponse(content={'success': True})
 
+    except HTTPException:
+        raise
+    except Exception as e:
+        return JSONResponse(
+            content={'success': False, 'error': str(e)},
+            status_code=500
+        )
+
+
+@app.post("/api/applications/bulk-delete")
+@limiter.limit("60/minute")
+def bulk_delete_applications(
+    request: Request,
+    app_ids: List[str] = Form(...),
+    language: str = Form(...)
+):
+    """Delete several applications with one Sheets batchUpdate."""
+    sheets_client = get_sheets_client()
+
+    try:
+        deleted = sheets_client.delete_applications(app_ids, language)
+
+        if deleted:
+            invalidate_apps_cache()
+            RECENT_APPS.clear()
+
+        return JSONResponse(content={'success': True, 'deleted': deleted})
+
     except Exception as e:
         return JSONResponse(
             content={'success': False, 'error': str(e)},
@@ -28,7 +28,7 @@ def followup_engine(mock_clients):
 def test_process_followups_no_due(followup_engine, mock_clients):
     sheets, _, _ = mock_clients
 
-    sheets.get_applications_for_followup.return_value = []  # no apps returned
+    sheets.get_applications_for_followup_multi.return_value = {"en": []}  # no apps returned
 
     stats = followup_engine.process_followups("en", dry_run=True)
 
@@ -62,10 +62,10 @@ def test_process_followups_with_due(followup_engine, mock_clients):
         "notes": ""
     }
 
-    sheets.get_applications_for_followup.return_value = [due_app]
+    sheets.get_applications_for_followup_multi.return_value = {"en": [due_app]}
 
     # attachment exists
-    attachments.get_attachment_path.return_value = Mock()
+    attachments.preload.return_value = {"test_cv.pdf": Mock()}
 
     # email send returns message ID
     mailer.send_with_delay.return_value = {"id": "msg-123"}
@@ -82,8 +82,9 @@ def test_process_followups_with_due(followup_engine, mock_clients):
     # Mailer was called
     mailer.send_with_delay.assert_called_once()
 
-    # Application follow-up updated
-    sheets.update_application_followup.assert_called_once()
+    # Application follow-up update buffered and flushed in one batch
+    sheets.queue_update_application_followup.assert_called_once()
+    sheets.flush.assert_called_once()
 
     # Activity logged
     sheets.log_activity.assert_any_call(
@@ -120,10 +121,10 @@ def test_process_followups_missing_attachment(followup_engine, mock_clients):
         "notes": ""
     }
 
-    sheets.get_applications_for_followup.return_value = [due_app]
+    sheets.get_applications_for_followup_multi.return_value = {"en": [due_app]}
 
     # Attachment does NOT exist
-    attachments.get_attachment_path.return_value = None
+    attachments.preload.return_value = {}
 
     stats = followup_engine.process_followups("en", dry_run=False)
 
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 
 from src.sheets import SheetsClient, APPLICATION_COLUMNS
-from src.config import DEFAULTS
+from src.config import DEFAULTS, SHEET_EN
 
 
 @pytest.fixture
@@ -44,9 +44,9 @@ def test_add_application(sheets_client, mock_service):
         position="Engineer"
     )
 
-    # UUID generated
+    # ID generated
     assert app_id is not None
-    assert len(app_id) == 36
+    assert len(app_id) == 26
 
     # Verify append was called
     mock_service.spreadsheets().values().append.assert_called_once()
@@ -81,6 +81,75 @@ def test_add_application_with_defaults(sheets_client, mock_service):
     assert values[3] == expected_position
 
 
+# ---------------------------------------------------------
+# TEST: add_applications_bulk
+# ---------------------------------------------------------
+def test_add_applications_bulk(sheets_client, mock_service):
+    """Bulk insert: one append, ids in input order, row cache seeded."""
+
+    mock_append = mock_service.spreadsheets().values().append
+    mock_append.return_value.execute.return_value = {
+        "updates": {"updatedRange": f"{SHEET_EN}!A42:Q43"}
+    }
+
+    app_ids = sheets_client.add_applications_bulk(
+        [
+            # 'language' in the field dict must not clash with the
+            # language argument the method passes itself
+            {"email": "one@example.com", "company": "One Corp", "language": "en"},
+            {"email": "two@example.com"},
+        ],
+        "en"
+    )
+
+    assert len(app_ids) == 2
+    assert all(len(app_id) == 26 for app_id in app_ids)
+
+    # Both rows shipped in a single values.append
+    mock_append.assert_called_once()
+    values = mock_append.call_args.kwargs['body']['values']
+    assert len(values) == 2
+    assert values[0][1] == "One Corp"
+    assert values[0][2] == "one@example.com"
+    assert values[1][2] == "two@example.com"
+
+    # Row cache seeded from each id's offset within the updatedRange
+    assert sheets_client._id_row_cache[(SHEET_EN, app_ids[0])] == 42
+    assert sheets_client._id_row_cache[(SHEET_EN, app_ids[1])] == 43
+
+
+# ---------------------------------------------------------
+# TEST: delete_applications (duplicates and ordering)
+# ---------------------------------------------------------
+def test_delete_applications_dedupes_and_orders_rows(sheets_client, mock_service):
+    """Duplicate ids collapse to one deletion, issued bottom-up."""
+
+    # Column A scan used by _find_row_by_id: header + two applications
+    mock_service.spreadsheets().values().get.return_value.execute.return_value = {
+        "values": [["ID"], ["app-one"], ["app-two"]]
+    }
+
+    # Sheet title -> sheetId lookup
+    mock_service.spreadsheets().get.return_value.execute.return_value = {
+        "sheets": [{"properties": {"sheetId": 7, "title": SHEET_EN}}]
+    }
+
+    deleted = sheets_client.delete_applications(
+        ["app-one", "app-two", "app-one"], "en"
+    )
+
+    # "app-one" was passed twice but its row is deleted only once
+    assert deleted == 2
+
+    body = mock_service.spreadsheets().batchUpdate.call_args.kwargs["body"]
+    ranges = [req["deleteDimension"]["range"] for req in body["requests"]]
+
+    # Rows 2 and 3 (0-based start indices 2 then 1), descending so the
+    # first deletion doesn't shift the second
+    assert [(r["startIndex"], r["endIndex"]) for r in ranges] == [(2, 3), (1, 2)]
+    assert all(r["sheetId"] == 7 for r in ranges)
+
+
 # ---------------------------------------------------------
 # TEST: column order
 # ---------------------------------------------------------
@@ -11,12 +11,12 @@ from src.config import DEFAULTS, TIMEZONE
 
 
 def test_generate_id():
-    """Test UUID generation."""
+    """Test unique ID generation."""
     id1 = generate_id()
     id2 = generate_id()
 
     assert id1 != id2
-    assert len(id1) == 36  # UUID4 format
+    assert len(id1) == 26  # base32-encoded UUID4 bytes, padding stripped
 
 
 def test_validate_email():